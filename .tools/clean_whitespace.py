@@ -7,40 +7,34 @@ Simple whitespace cleaner for Batch 1:
 - Operate on all .py files under backend/
 - Print list of changed files
 """
-import os
+import re
 import sys
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 BACKEND = ROOT / 'backend'
 
-changed = []
+# Trailing spaces/tabs before a newline or at EOF (covers whitespace-only lines)
+_TRAIL = re.compile(rb'[ \t]+(?=\n|\Z)')
+
 
-for path in sorted(BACKEND.rglob('*.py')):
-    try:
-        text = path.read_text(encoding='utf-8')
-    except Exception:
-        # fallback to latin-1
-        text = path.read_text(encoding='latin-1')
-    lines = text.splitlines()
-    new_lines = []
-    modified = False
-    for ln in lines:
-        # Remove trailing spaces/tabs
-        stripped_trail = ln.rstrip(' \t')
-        # If line contained only whitespace, make it empty
-        if stripped_trail.strip() == '':
-            if stripped_trail != '':
-                # had spaces/tabs only -> normalize to empty
-                stripped_trail = ''
-        if stripped_trail != ln:
-            modified = True
-        new_lines.append(stripped_trail)
+def clean_file(path):
+    """Clean a single file in place; return its relative path if it changed"""
+    data = path.read_bytes()
+    new = _TRAIL.sub(b'', data.replace(b'\r\n', b'\n'))
     # Ensure single trailing newline at EOF
-    new_text = '\n'.join(new_lines) + '\n'
-    if new_text != text:
-        path.write_text(new_text, encoding='utf-8')
-        changed.append(str(path.relative_to(ROOT)))
+    new = new.rstrip(b'\n') + b'\n'
+    if new != data:
+        path.write_bytes(new)
+        return str(path.relative_to(ROOT))
+    return None
+
+
+changed = []
+for p in sorted(BACKEND.rglob('*.py')):
+    rel = clean_file(p)
+    if rel:
+        changed.append(rel)
 
 # Print summary
 if changed:
@@ -1,226 +1,546 @@
+import asyncio
+import functools
+import random
+import ssl
 import time
 import hmac
 import hashlib
 import logging
-import requests
+import httpx
 import threading
-import websocket
+import websockets
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 from backend.config import BINANCE_API_URL
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+
+# Signed bodies are sent pre-encoded, so httpx does not urlencode them again
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+
+def _decode(resp):
+    """Decode a JSON response body straight from bytes (orjson when available)"""
+    return _json_loads(resp.content)
+
+
+try:
+    import h2  # noqa: F401  # HTTP/2 support for httpx
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - h2 is optional
+    _HTTP2_AVAILABLE = False
+
+# exchangeInfo / 24hr-all are large JSON bodies that compress very well.
+# Only advertise brotli when httpx can actually decode it.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:  # pragma: no cover - brotli is optional
+        _ACCEPT_ENCODING = "gzip, deflate"
+
 # Module logger
 logger = logging.getLogger(__name__)
 
+# Shared TLS context for market-stream sockets: CA certificates are loaded once
+# instead of on every (re)connect. Kept separate from the httpx client, which
+# sets its own ALPN protocols (h2) on the context it is given.
+_WS_SSL_CONTEXT = ssl.create_default_context()
+
+# Per-endpoint TTLs (seconds) for the hot public market-data GETs. Klines stay
+# short because the last candle keeps changing until it closes.
+_TICKER_TTL = 1
+_TICKER_24HR_TTL = 3
+_KLINES_TTL = 2
+_RESPONSE_CACHE_MAX = 512
+# Above this many symbols one all-symbols request beats N concurrent ones
+_BATCH_ALL_THRESHOLD = 100
+
+# exchangeInfo fields actually consumed (symbol picker + order filters);
+# everything else in the ~1 MB response is dropped before caching
+_EXCHANGE_INFO_SYMBOL_FIELDS = (
+    "symbol",
+    "status",
+    "baseAsset",
+    "quoteAsset",
+    "baseAssetPrecision",
+    "quotePrecision",
+    "isSpotTradingAllowed",
+    "filters",
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _sym(symbol):
+    """Canonical upper-case symbol; the same few pairs are requested repeatedly"""
+    return symbol.upper()
+
+
+def _index_balances(data):
+    """Balances keyed by asset; Binance already sends asset codes upper-case"""
+    return {bal["asset"]: bal for bal in data.get("balances", ())}
+
+
+@functools.lru_cache(maxsize=256)
+def _form_token(value):
+    """Upper-cased, form-encoded symbol/side/type/timeInForce value"""
+    return quote_plus(value.upper())
+
+
+_PRICED_ORDER_TYPES = frozenset(("LIMIT", "STOP_LOSS_LIMIT", "TAKE_PROFIT_LIMIT"))
+
+
+@functools.lru_cache(maxsize=512)
+def _symbol_query(symbol, **params):
+    """Encoded query string for unsigned multi-param symbol endpoints (klines)"""
+    return urlencode({"symbol": _sym(symbol), **params})
+
 
 class BinanceRESTClient:
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "api_key",
+        "api_secret",
+        "base_url",
+        "_secret_bytes",
+        "_hmac_template",
+        "_hmac_local",
+        "_recv_window",
+        "_account_url",
+        "_trades_url",
+        "_depth_endpoint",
+        "_price_endpoint",
+        "_ticker24_endpoint",
+        "_klines_endpoint",
+        "_exchange_info_endpoint",
+        "_open_orders_endpoint",
+        "_all_orders_endpoint",
+        "_order_endpoint",
+        "_order_test_endpoint",
+        "_user_stream_endpoint",
+        "_session",
+        "_exchange_info_cache",
+        "_exchange_info_cache_time",
+        "_exchange_info_cache_ttl",
+        "_exchange_info_index",
+        "_ticker24_all_cache",
+        "_ticker24_all_cache_time",
+        "_ticker24_all_cache_ttl",
+        "_ticker24_index",
+        "_account_info_cache",
+        "_account_info_cache_time",
+        "_account_info_cache_ttl",
+        "_account_info_lock",
+        "_account_info_generation",
+        "_balance_index",
+        "_balance_index_time",
+        "_response_cache",
+        "_response_cache_lock",
+    )
+
     def __init__(self):
         from backend.config import BINANCE_API_KEY, BINANCE_API_SECRET
         self.api_key = BINANCE_API_KEY
         self.api_secret = BINANCE_API_SECRET
+        # Pre-keyed HMAC state; copied per request so the secret is encoded and
+        # the inner/outer pads are derived only once
+        self._secret_bytes = (self.api_secret or "").encode('utf-8')
+        self._hmac_template = hmac.new(self._secret_bytes, None, hashlib.sha256)
+        # Per-thread copies of the template so concurrent signers (asyncio
+        # worker threads) never contend on the same HMAC object's lock
+        self._hmac_local = threading.local()
+        # Binance odrzuci zapytanie starsze niż okno, zamiast wykonać je z opóźnieniem
+        self._recv_window = 5000
         self.base_url = BINANCE_API_URL
+        # Endpoint URLs built once instead of on every call
+        self._account_url = f"{self.base_url}/v3/account"
+        self._trades_url = f"{self.base_url}/v3/myTrades"
+        self._depth_endpoint = f"{self.base_url}/v3/depth"
+        self._price_endpoint = f"{self.base_url}/v3/ticker/price"
+        self._ticker24_endpoint = f"{self.base_url}/v3/ticker/24hr"
+        self._klines_endpoint = f"{self.base_url}/v3/klines"
+        self._exchange_info_endpoint = f"{self.base_url}/v3/exchangeInfo"
+        self._open_orders_endpoint = f"{self.base_url}/v3/openOrders"
+        self._all_orders_endpoint = f"{self.base_url}/v3/allOrders"
+        self._order_endpoint = f"{self.base_url}/v3/order"
+        self._order_test_endpoint = f"{self.base_url}/v3/order/test"
+        self._user_stream_endpoint = f"{self.base_url}/v3/userDataStream"
         # Cache for exchange info (updates rarely)
         self._exchange_info_cache = None
         self._exchange_info_cache_time = None
         self._exchange_info_cache_ttl = 3600  # 1 hour TTL
+        self._exchange_info_index = {}  # symbol -> slim symbol info
         # Short cache for 24hr ticker (all symbols) to cut bandwidth
         self._ticker24_all_cache = None
         self._ticker24_all_cache_time = None
         self._ticker24_all_cache_ttl = 5  # 5 seconds TTL
+        self._ticker24_index = {}  # symbol -> entry of the cached all-symbols list
+        # Very short account cache so bursts of get_balance calls share one
+        # signed request; invalidated whenever an order is placed/cancelled
+        self._account_info_cache = None
+        self._account_info_cache_time = 0.0
+        self._account_info_cache_ttl = 0.5  # seconds
+        # Asset -> balance index; filled by get_account_info or, when that is
+        # cold, by a lighter omitZeroBalances request from get_balance
+        self._balance_index = None
+        self._balance_index_time = 0.0
+        self._account_info_lock = threading.Lock()
+        self._account_info_generation = 0
+        # URL -> (expires_at, data) for single-symbol ticker/klines lookups
+        self._response_cache = {}
+        self._response_cache_lock = threading.Lock()
+        # Persistent HTTP session: keep-alive connection pooling instead of a new
+        # TCP+TLS handshake per call; HTTP/2 multiplexes concurrent calls over
+        # one connection. API key header is attached once here.
+        self._session = self._create_session()
 
         # Use module logger instead of print; do NOT log secrets
-        logger = logging.getLogger(__name__)
         try:
-            import hashlib
             def _fingerprint(s: str) -> str:
                 if not s:
                     return "none"
                 return hashlib.sha256(s.encode("utf-8")).hexdigest()[:8]
-            logger.debug(
-                "[BinanceRESTClient] API credentials loaded: key=%s secret=%s (key_fp=%s)",
-                bool(self.api_key), bool(self.api_secret), _fingerprint(self.api_key)
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[BinanceRESTClient] API credentials loaded: key=%s secret=%s (key_fp=%s)",
+                    bool(self.api_key), bool(self.api_secret), _fingerprint(self.api_key)
+                )
         except Exception:
             # Ensure initialization never fails because of logging
             logger.debug("[BinanceRESTClient] API credentials loaded")
 
+    def _create_session(self):
+        """Build a pooled keep-alive HTTP/2 client carrying the API key header"""
+        # retries cover connection failures only (httpx does not retry on status)
+        transport = httpx.HTTPTransport(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            retries=3,
+        )
+        return httpx.Client(headers=self._headers(), timeout=10, transport=transport)
+
+    def close_session(self):
+        """Release pooled HTTP connections"""
+        self._session.close()
+
+    def fetch_many(self, calls, max_workers=8):
+        """Run several REST calls concurrently and return results in order
+
+        Args:
+            calls: list of (method_name, kwargs) tuples, e.g.
+                [("get_ticker", {"symbol": "BTCUSDT"}), ("get_account_info", {})]
+            max_workers: upper bound on parallel requests
+
+        The calls share the pooled session, so their round-trips overlap and the
+        total latency is roughly that of the slowest call. Errors propagate.
+        """
+        if not calls:
+            return []
+        # Bind to the synchronous REST implementations even on subclasses that
+        # override some names with async wrappers (BinanceClient)
+        funcs = [functools.partial(getattr(BinanceRESTClient, name), self, **kwargs) for name, kwargs in calls]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(funcs))) as pool:
+            futures = [pool.submit(func) for func in funcs]
+            return [future.result() for future in futures]
+
+    # --- URL builders shared by the sync methods and the async client ---
+    # Symbols are [A-Z0-9]+ and limit is an int, so these skip urlencode
+    def _orderbook_url(self, symbol, limit):
+        return f"{self._depth_endpoint}?symbol={_sym(symbol)}&limit={int(limit)}"
+
+    def _ticker_url(self, symbol):
+        return f"{self._price_endpoint}?symbol={_sym(symbol)}"
+
+    def _ticker_24hr_url(self, symbol=None):
+        if symbol is None:
+            return self._ticker24_endpoint
+        return f"{self._ticker24_endpoint}?symbol={_sym(symbol)}"
+
+    def _exchange_info_url(self):
+        return self._exchange_info_endpoint
+
     def get_orderbook(self, symbol, limit=10):
-        endpoint = "/v3/depth"
-        params = {"symbol": symbol.upper(), "limit": limit}
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        resp = requests.get(url, timeout=10)
+        url = self._orderbook_url(symbol, limit)
+        resp = self._session.get(url, timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
 
     # --- User Data Stream (listenKey) management ---
+    def _user_data_stream_url(self, listen_key=None):
+        if listen_key is None:
+            return self._user_stream_endpoint
+        return f"{self._user_stream_endpoint}?{urlencode({'listenKey': listen_key})}"
+
     def start_user_data_stream(self):
         """Start a new user data stream and return listenKey"""
-        endpoint = "/v3/userDataStream"
-        url = f"{self.base_url}{endpoint}"
-        resp = requests.post(url, headers=self._headers(), timeout=10)
+        resp = self._session.post(self._user_data_stream_url(), timeout=10)
         resp.raise_for_status()
-        return resp.json()  # {"listenKey": "..."}
+        return _decode(resp)  # {"listenKey": "..."}
 
     def keepalive_user_data_stream(self, listen_key: str):
         """Ping/keepalive existing user data stream"""
-        endpoint = "/v3/userDataStream"
-        params = {"listenKey": listen_key}
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        resp = requests.put(url, headers=self._headers(), timeout=10)
+        resp = self._session.put(self._user_data_stream_url(listen_key), timeout=10)
         resp.raise_for_status()
         return True
 
     def close_user_data_stream(self, listen_key: str):
         """Close user data stream"""
-        endpoint = "/v3/userDataStream"
-        params = {"listenKey": listen_key}
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        resp = requests.delete(url, headers=self._headers(), timeout=10)
+        resp = self._session.delete(self._user_data_stream_url(listen_key), timeout=10)
         resp.raise_for_status()
         return True
 
-    def _sign(self, params):
-        query_string = urlencode(params)
-        # Generate signature but do NOT log full query_string or signature to avoid leaking secrets
-        signature = hmac.new(self.api_secret.encode('utf-8'), query_string.encode('utf-8'), hashlib.sha256).hexdigest()
-        logger = logging.getLogger(__name__)
-        # Log only the parameter keys and length of signature (no sensitive values)
-        try:
-            logger.debug("Signing params keys: %s", list(params.keys()))
-        except Exception:
-            # Avoid any logging failure impacting signing
-            pass
-        params['signature'] = signature
-        return params
+    def _signature(self, query_string):
+        # hmac.digest() re-derives the key pads on every call; copying the
+        # pre-keyed OpenSSL state is measurably cheaper for our short queries
+        template = getattr(self._hmac_local, "mac", None)
+        if template is None:
+            template = self._hmac_local.mac = self._hmac_template.copy()
+        mac = template.copy()
+        mac.update(query_string.encode('utf-8'))
+        return mac.hexdigest()
+
+    def _signed_query(self, params):
+        """Return the signed query string, encoding params only once"""
+        return self._sign_query(urlencode(params))
+
+    def _sign_query(self, query_string):
+        """Append recvWindow and the signature to an already URL-safe query string"""
+        query_string = f"{query_string}&recvWindow={self._recv_window}"
+        return f"{query_string}&signature={self._signature(query_string)}"
 
     def _headers(self):
-        return {"X-MBX-APIKEY": self.api_key}
+        return {"X-MBX-APIKEY": self.api_key, "Accept-Encoding": _ACCEPT_ENCODING}
 
     def get_account_info(self):
-        endpoint = "/v3/account"
-        params = {"timestamp": int(time.time() * 1000)}
-        params = self._sign(params)
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        resp = requests.get(url, headers=self._headers(), timeout=10)
+        cached = self._cached_account_info()
+        if cached is not None:
+            return cached
+        generation = self._account_info_generation
+        resp = self._session.get(self._account_info_url(), timeout=10)
+        resp.raise_for_status()
+        return self._store_account_info(_decode(resp), generation)
+
+    def _account_info_url(self, extra_query=""):
+        query_string = f"timestamp={time.time_ns() // 1_000_000}{extra_query}"
+        return f"{self._account_url}?{self._sign_query(query_string)}"
+
+    # The lock only guards cache state; it is never held across network I/O,
+    # so the async client can consult the cache without stalling the loop
+    def _cached_account_info(self):
+        with self._account_info_lock:
+            if (
+                self._account_info_cache is not None
+                and time.monotonic() - self._account_info_cache_time < self._account_info_cache_ttl
+            ):
+                return self._account_info_cache
+        return None
+
+    def _store_account_info(self, data, generation):
+        with self._account_info_lock:
+            # Skip storing if an order action invalidated the cache mid-request
+            if generation == self._account_info_generation:
+                now = time.monotonic()
+                self._account_info_cache = data
+                self._account_info_cache_time = now
+                self._store_balance_index(data, now)
+        return data
+
+    def _store_balance_index(self, data, now):
+        self._balance_index = _index_balances(data)
+        self._balance_index_time = now
+
+    def _get_balance_index(self):
+        """Return balances keyed by asset, cached for the account TTL"""
+        with self._account_info_lock:
+            if (
+                self._balance_index is not None
+                and time.monotonic() - self._balance_index_time < self._account_info_cache_ttl
+            ):
+                return self._balance_index
+            generation = self._account_info_generation
+        # Zero balances are implied by absence, so skip them on the wire
+        resp = self._session.get(self._account_info_url("&omitZeroBalances=true"), timeout=10)
+        resp.raise_for_status()
+        data = _decode(resp)
+        with self._account_info_lock:
+            if generation != self._account_info_generation:
+                return _index_balances(data)
+            self._store_balance_index(data, time.monotonic())
+            return self._balance_index
+
+    def invalidate_account_cache(self):
+        """Drop cached account info (balances change after order actions)"""
+        with self._account_info_lock:
+            self._account_info_cache = None
+            self._balance_index = None
+            self._account_info_generation += 1
+
+    def _cached_response(self, url):
+        """Return the cached body for a public GET url if still fresh, else None"""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(url)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+
+    def _store_response(self, url, data, ttl):
+        now = time.monotonic()
+        with self._response_cache_lock:
+            if len(self._response_cache) >= _RESPONSE_CACHE_MAX:
+                # Drop expired entries so rarely used keys do not pile up
+                self._response_cache = {
+                    key: entry for key, entry in self._response_cache.items() if entry[0] > now
+                }
+            self._response_cache[url] = (now + ttl, data)
+        return data
+
+    def _cached_get(self, url, ttl):
+        cached = self._cached_response(url)
+        if cached is not None:
+            return cached
+        resp = self._session.get(url, timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        return self._store_response(url, _decode(resp), ttl)
 
     def get_ticker(self, symbol):
-        endpoint = "/v3/ticker/price"
-        params = {"symbol": symbol.upper()}
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        return resp.json()
+        return self._cached_get(self._ticker_url(symbol), _TICKER_TTL)
 
     def get_ticker_24hr(self, symbol):
         """Get 24hr ticker price change statistics including changePercent"""
-        endpoint = "/v3/ticker/24hr"
-        params = {"symbol": symbol.upper()}
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        return resp.json()
-
-    def get_exchange_info(self):
-        """Get exchange info with caching to reduce API calls"""
-        now = datetime.now()
+        cached = self._ticker_24hr_from_all(symbol)
+        if cached is not None:
+            return cached
+        return self._cached_get(self._ticker_24hr_url(symbol), _TICKER_24HR_TTL)
 
-        # Check if cache is valid
+    def _cached_exchange_info(self):
+        """Return cached exchange info if still fresh, else None"""
         if (
             self._exchange_info_cache
             and self._exchange_info_cache_time
-            and now - self._exchange_info_cache_time < timedelta(seconds=self._exchange_info_cache_ttl)
+            and datetime.now() - self._exchange_info_cache_time < timedelta(seconds=self._exchange_info_cache_ttl)
         ):
             logger.debug("Using cached exchange info")
             return self._exchange_info_cache
+        return None
+
+    def _store_exchange_info(self, data):
+        symbols = [
+            {k: info[k] for k in _EXCHANGE_INFO_SYMBOL_FIELDS if k in info}
+            for info in data.get("symbols", [])
+        ]
+        slim = {"symbols": symbols}
+        self._exchange_info_cache = slim
+        self._exchange_info_index = {info["symbol"]: info for info in symbols if "symbol" in info}
+        self._exchange_info_cache_time = datetime.now()
+        logger.debug("Fetched and cached new exchange info")
+        return slim
+
+    def get_exchange_info(self):
+        """Get exchange info (symbols pruned to the fields we use), cached"""
+        cached = self._cached_exchange_info()
+        if cached is not None:
+            return cached
 
-        # Fetch new data
-        endpoint = "/v3/exchangeInfo"
-        url = f"{self.base_url}{endpoint}"
-        resp = requests.get(url, timeout=10)
+        resp = self._session.get(self._exchange_info_url(), timeout=10)
         resp.raise_for_status()
+        return self._store_exchange_info(_decode(resp))
 
-        # Update cache
-        self._exchange_info_cache = resp.json()
-        self._exchange_info_cache_time = now
-        logger.debug("Fetched and cached new exchange info")
+    def get_exchange_info_raw(self):
+        """Full, uncached exchangeInfo response for the rare caller needing all fields"""
+        resp = self._session.get(self._exchange_info_url(), timeout=10)
+        resp.raise_for_status()
+        return _decode(resp)
 
-        return self._exchange_info_cache
+    def get_symbol_info(self, symbol):
+        """Slim exchange info for one symbol (O(1) lookup), or None if unknown"""
+        if self._cached_exchange_info() is None:
+            self.get_exchange_info()
+        return self._exchange_info_index.get(_sym(symbol))
 
-    def get_ticker_24hr_all(self):
-        """Get 24hr ticker for all symbols with short-lived caching"""
-        now = datetime.now()
+    def _cached_ticker_24hr_all(self):
+        """Return cached 24hr tickers (all symbols) if still fresh, else None"""
         if (
             self._ticker24_all_cache is not None and
             self._ticker24_all_cache_time is not None and
-            (now - self._ticker24_all_cache_time) < timedelta(seconds=self._ticker24_all_cache_ttl)
+            (datetime.now() - self._ticker24_all_cache_time) < timedelta(seconds=self._ticker24_all_cache_ttl)
         ):
             return self._ticker24_all_cache
+        return None
 
-        endpoint = "/v3/ticker/24hr"
-        url = f"{self.base_url}{endpoint}"
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
+    def _store_ticker_24hr_all(self, data):
+        self._ticker24_index = {t["symbol"]: t for t in data}
         self._ticker24_all_cache = data
-        self._ticker24_all_cache_time = now
+        self._ticker24_all_cache_time = datetime.now()
         return data
 
+    def _ticker_24hr_from_all(self, symbol):
+        """Single-symbol 24hr entry from a fresh all-symbols snapshot, else None"""
+        if self._cached_ticker_24hr_all() is None:
+            return None
+        return self._ticker24_index.get(_sym(symbol))
+
+    def get_ticker_24hr_all(self):
+        """Get 24hr ticker for all symbols with short-lived caching"""
+        cached = self._cached_ticker_24hr_all()
+        if cached is not None:
+            return cached
+
+        resp = self._session.get(self._ticker_24hr_url(), timeout=10)
+        resp.raise_for_status()
+        return self._store_ticker_24hr_all(_decode(resp))
+
     def get_klines(self, symbol, interval="1m", limit=100):
         """Get klines/candlestick data for a symbol"""
-        endpoint = "/v3/klines"
-        params = {
-            "symbol": symbol.upper(),
-            "interval": interval,
-            "limit": limit
-        }
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        return resp.json()
+        url = f"{self._klines_endpoint}?{_symbol_query(symbol, interval=interval, limit=limit)}"
+        return self._cached_get(url, _KLINES_TTL)
+
+    def _account_trades_url(self, symbol):
+        # Symbol (A-Z0-9) and timestamp are URL-safe, so skip urlencode
+        query_string = f"symbol={_sym(symbol)}&timestamp={time.time_ns() // 1_000_000}"
+        return f"{self._trades_url}?{self._sign_query(query_string)}"
 
     def get_account_trades(self, symbol):
-        endpoint = "/v3/myTrades"
-        params = {"symbol": symbol.upper(), "timestamp": int(time.time() * 1000)}
-        params = self._sign(params)
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        logger = logging.getLogger(__name__)
-        logger.debug("get_account_trades url: %s", url)
+        url = self._account_trades_url(symbol)
+        logger.debug("get_account_trades request for symbol=%s", symbol)
         # Do not log headers content (may contain api key)
-        resp = requests.get(url, headers=self._headers(), timeout=10)
+        resp = self._session.get(url, timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
 
     def get_balance(self, asset):
-        account = self.get_account_info()
-        for bal in account.get("balances", []):
-            if bal["asset"].upper() == asset.upper():
-                return bal
-        return {"asset": asset.upper(), "free": "0", "locked": "0"}
+        balances = self._get_balance_index()
+        asset = _sym(asset)
+        return balances.get(asset, {"asset": asset, "free": "0", "locked": "0"})
+
+    def _open_orders_url(self, symbol=None):
+        query_string = f"timestamp={time.time_ns() // 1_000_000}"
+        if symbol:
+            query_string = f"symbol={_form_token(symbol)}&{query_string}"
+        return f"{self._open_orders_endpoint}?{self._sign_query(query_string)}"
 
     def get_open_orders(self, symbol=None):
         """Get current open orders for a symbol or all symbols"""
-        endpoint = "/v3/openOrders"
-        params = {"timestamp": int(time.time() * 1000)}
-        if symbol:
-            params["symbol"] = symbol.upper()
-        params = self._sign(params)
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        logger = logging.getLogger(__name__)
+        url = self._open_orders_url(symbol)
         logger.debug("get_open_orders url constructed")
-        resp = requests.get(url, headers=self._headers(), timeout=10)
+        resp = self._session.get(url, timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
 
-    def get_all_orders(self, symbol, limit=500, order_id=None, start_time=None, end_time=None):
-        """Get all orders history for a symbol"""
-        endpoint = "/v3/allOrders"
+    def _all_orders_url(self, symbol, limit=500, order_id=None, start_time=None, end_time=None):
         params = {
-            "symbol": symbol.upper(),
-            "timestamp": int(time.time() * 1000),
+            "symbol": _sym(symbol),
+            "timestamp": time.time_ns() // 1_000_000,
             "limit": min(limit, 1000)  # Max 1000 according to API docs
         }
         if order_id:
@@ -229,35 +549,71 @@ class BinanceRESTClient:
             params["startTime"] = start_time
         if end_time:
             params["endTime"] = end_time
-        params = self._sign(params)
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        logger = logging.getLogger(__name__)
+        return f"{self._all_orders_endpoint}?{self._signed_query(params)}"
+
+    def get_all_orders(self, symbol, limit=500, order_id=None, start_time=None, end_time=None):
+        """Get all orders history for a symbol"""
+        url = self._all_orders_url(symbol, limit, order_id, start_time, end_time)
         logger.debug("get_all_orders url constructed for symbol=%s limit=%s", symbol, limit)
-        resp = requests.get(url, headers=self._headers(), timeout=10)
+        resp = self._session.get(url, timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
 
-    def get_order_status(self, symbol, order_id=None, orig_client_order_id=None):
-        """Get specific order status by orderId or origClientOrderId"""
-        endpoint = "/v3/order"
-        params = {
-            "symbol": symbol.upper(),
-            "timestamp": int(time.time() * 1000)
-        }
+    def _order_ref_query(self, symbol, order_id=None, orig_client_order_id=None):
+        """Signed symbol + order reference query shared by order status and cancel"""
         if order_id:
-            params["orderId"] = order_id
+            ref = f"orderId={quote_plus(str(order_id))}"
         elif orig_client_order_id:
-            params["origClientOrderId"] = orig_client_order_id
+            ref = f"origClientOrderId={quote_plus(orig_client_order_id)}"
         else:
             raise ValueError("Either orderId or origClientOrderId must be provided")
+        return self._sign_query(
+            f"symbol={_form_token(symbol)}&timestamp={time.time_ns() // 1_000_000}&{ref}"
+        )
+
+    def _order_status_url(self, symbol, order_id=None, orig_client_order_id=None):
+        return f"{self._order_endpoint}?{self._order_ref_query(symbol, order_id, orig_client_order_id)}"
 
-        params = self._sign(params)
-        url = f"{self.base_url}{endpoint}?{urlencode(params)}"
-        logger = logging.getLogger(__name__)
+    def get_order_status(self, symbol, order_id=None, orig_client_order_id=None):
+        """Get specific order status by orderId or origClientOrderId"""
+        url = self._order_status_url(symbol, order_id, orig_client_order_id)
         logger.debug("get_order_status request for symbol=%s", symbol)
-        resp = requests.get(url, headers=self._headers(), timeout=10)
+        resp = self._session.get(url, timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
+
+    def _order_body(self, symbol, side, order_type, quantity, price=None, time_in_force="GTC"):
+        """Build the signed form body for /v3/order and /v3/order/test"""
+        # Written straight into the query string: no params dict, no urlencode
+        # walk. Enum-like fields are few distinct values, so their encoding is
+        # memoised; only the numbers are quoted per call.
+        order_type = _form_token(order_type)
+        query_string = (
+            f"symbol={_form_token(symbol)}&side={_form_token(side)}&type={order_type}"
+            f"&quantity={quote_plus(str(quantity))}"
+        )
+
+        # Add price for LIMIT orders
+        if order_type in _PRICED_ORDER_TYPES:
+            if price is None:
+                raise ValueError(f"Price is required for {order_type} orders")
+            query_string += f"&price={quote_plus(str(price))}&timeInForce={_form_token(time_in_force)}"
+
+        return self._sign_query(f"{query_string}&timestamp={time.time_ns() // 1_000_000}")
+
+    @staticmethod
+    def _check_order_response(resp):
+        if resp.status_code >= 400:
+            # Try to parse error body to include code/msg from Binance
+            err_payload = None
+            try:
+                err_payload = _decode(resp)
+            except Exception:
+                err_payload = {'raw': resp.text[:500]}
+            logger.error("place_order HTTP %s body=%s", resp.status_code, str(err_payload)[:500])
+            # Raise to let async layer handle the error
+            resp.raise_for_status()
+        return _decode(resp)
 
     def place_order(self, symbol, side, order_type, quantity, price=None, time_in_force="GTC"):
         """Place a new order on Binance
@@ -270,40 +626,14 @@ class BinanceRESTClient:
             price: Price for LIMIT orders (required for LIMIT, STOP_LOSS_LIMIT, TAKE_PROFIT_LIMIT)
             time_in_force: 'GTC', 'IOC', 'FOK' (default: 'GTC')
         """
-        endpoint = "/v3/order"
-        params = {
-            "symbol": symbol.upper(),
-            "side": side.upper(),
-            "type": order_type.upper(),
-            "quantity": str(quantity),
-            "timestamp": int(time.time() * 1000)
-        }
-
-        # Add price for LIMIT orders
-        if order_type.upper() in ['LIMIT', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT']:
-            if price is None:
-                raise ValueError(f"Price is required for {order_type} orders")
-            params["price"] = str(price)
-            params["timeInForce"] = time_in_force.upper()
-
         # Sign and send request for any order type
-        params = self._sign(params)
-        url = f"{self.base_url}{endpoint}"
-        logger = logging.getLogger(__name__)
+        body = self._order_body(symbol, side, order_type, quantity, price, time_in_force)
+        url = self._order_endpoint
         logger.debug("Placing order: symbol=%s side=%s type=%s", symbol, side, order_type)
         # Do NOT log params (they contain signature and possibly sensitive info)
-        resp = requests.post(url, data=params, headers=self._headers(), timeout=10)
-        if resp.status_code >= 400:
-            # Try to parse error body to include code/msg from Binance
-            err_payload = None
-            try:
-                err_payload = resp.json()
-            except Exception:
-                err_payload = {'raw': resp.text[:500]}
-            logger.error("place_order HTTP %s body=%s", resp.status_code, str(err_payload)[:500])
-            # Raise to let async layer handle the error
-            resp.raise_for_status()
-        return resp.json()
+        resp = self._session.post(url, content=body, headers=_FORM_HEADERS, timeout=10)
+        self.invalidate_account_cache()
+        return self._check_order_response(resp)
 
     def test_order(self, symbol, side, order_type, quantity, price=None, time_in_force="GTC"):
         """Test a new order (same as place_order but doesn't execute)
@@ -316,29 +646,15 @@ class BinanceRESTClient:
             price: Price for LIMIT orders (required for LIMIT, STOP_LOSS_LIMIT, TAKE_PROFIT_LIMIT)
             time_in_force: 'GTC', 'IOC', 'FOK' (default: 'GTC')
         """
-        endpoint = "/v3/order/test"
-        params = {
-            "symbol": symbol.upper(),
-            "side": side.upper(),
-            "type": order_type.upper(),
-            "quantity": str(quantity),
-            "timestamp": int(time.time() * 1000)
-        }
-
-        # Add price for LIMIT orders
-        if order_type.upper() in ['LIMIT', 'STOP_LOSS_LIMIT', 'TAKE_PROFIT_LIMIT']:
-            if price is None:
-                raise ValueError(f"Price is required for {order_type} orders")
-            params["price"] = str(price)
-            params["timeInForce"] = time_in_force.upper()
-
-        params = self._sign(params)
-        url = f"{self.base_url}{endpoint}"
-        logger = logging.getLogger(__name__)
+        body = self._order_body(symbol, side, order_type, quantity, price, time_in_force)
+        url = self._order_test_endpoint
         logger.debug("Testing order: symbol=%s side=%s type=%s", symbol, side, order_type)
-        resp = requests.post(url, data=params, headers=self._headers(), timeout=10)
+        resp = self._session.post(url, content=body, headers=_FORM_HEADERS, timeout=10)
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
+
+    def _cancel_body(self, symbol, order_id=None, orig_client_order_id=None):
+        return self._order_ref_query(symbol, order_id, orig_client_order_id)
 
     def cancel_order(self, symbol, order_id=None, orig_client_order_id=None):
         """Cancel an active order
@@ -348,111 +664,236 @@ class BinanceRESTClient:
             order_id: Order ID to cancel (either this or orig_client_order_id is required)
             orig_client_order_id: Client Order ID to cancel
         """
-        endpoint = "/v3/order"
-        params = {
-            "symbol": symbol.upper(),
-            "timestamp": int(time.time() * 1000)
-        }
-
-        if order_id:
-            params["orderId"] = order_id
-        elif orig_client_order_id:
-            params["origClientOrderId"] = orig_client_order_id
-        else:
-            raise ValueError("Either orderId or origClientOrderId must be provided")
-
-        params = self._sign(params)
-        url = f"{self.base_url}{endpoint}"
-        logger = logging.getLogger(__name__)
+        body = self._cancel_body(symbol, order_id, orig_client_order_id)
+        url = self._order_endpoint
         logger.debug("Cancel order requested for symbol=%s", symbol)
         # Do not log params which include signature
-        resp = requests.delete(url, data=params, headers=self._headers(), timeout=10)
+        # httpx.delete() takes no body, so go through request()
+        resp = self._session.request("DELETE", url, content=body, headers=_FORM_HEADERS, timeout=10)
+        self.invalidate_account_cache()
         resp.raise_for_status()
-        return resp.json()
+        return _decode(resp)
+
+
+def _decode_frame(message):
+    """Decode a WS frame once for all queues; None for bad JSON or control replies"""
+    try:
+        data = _json_loads(message)
+    except ValueError:
+        logger.warning("WS: dropping undecodable frame")
+        return None
+    # Odpowiedzi na SUBSCRIBE/UNSUBSCRIBE ({"result": null, "id": n}) to nie dane rynkowe
+    if isinstance(data, dict) and "id" in data and "result" in data:
+        return None
+    return data
+
+
+_STREAM_PREFIX = b'{"stream":"'
+
+
+def _stream_name(frame):
+    """Stream name of a combined-stream frame, read without parsing the payload"""
+    if isinstance(frame, str):
+        frame = frame.encode()
+    # Binance always serialises "stream" first: {"stream":"<name>","data":{...}}
+    if frame.startswith(_STREAM_PREFIX):
+        end = frame.find(b'"', len(_STREAM_PREFIX))
+        if end != -1:
+            return frame[len(_STREAM_PREFIX):end].decode()
+    return None
+
+
+def _combined_stream_url(ws_url, streams):
+    return f"{ws_url}/stream?streams={'/'.join(streams)}"
+
+
+def _control_frame(method, streams, request_id):
+    """SUBSCRIBE/UNSUBSCRIBE frame changing streams on a live connection"""
+    return json.dumps({"method": method, "params": list(streams), "id": request_id})
+
+
+# Log only every Nth drop so an overloaded consumer does not flood the log
+_DROP_LOG_EVERY = 100
+
 
 class BinanceWebSocketClient:
-    def __init__(self, streams, queues=None, main_loop=None):
-        from .config import BINANCE_WS_URL, BINANCE_ENV
+    """Asyncio-native market stream client running on the main event loop.
+
+    Frames are read with `websockets` directly on the loop and put into the
+    queues without any thread handoff. Queues receive decoded JSON objects
+    (one parse per frame, shared by all consumers); pass raw=True to forward
+    the undecoded frames (bytes) instead; stream_queues additionally routes
+    each stream's frames to its own queue. Queues should be bounded: when one is full
+    its oldest frame is dropped to make room for the newest.
+    """
+
+    def __init__(self, streams, queues=None, main_loop=None, raw=False, stream_queues=None):
+        from .config import BINANCE_WS_URL, BINANCE_ENV, WS_COMPRESSION
         self.ws_url = BINANCE_WS_URL.rstrip('/')
         self.env = BINANCE_ENV
-        self.streams = streams
+        self.streams = tuple(streams)
+        # Combined-stream URL built once; reconnects reuse it as-is
+        self._combined_url = _combined_stream_url(self.ws_url, self.streams)
+        self._control_id = 0
         self.should_reconnect = True
-        self.threads = []
-        self.ws_apps = []
-        self.queues = queues if queues is not None else []  # Lista kolejek do forwardowania wiadomości
+        # Reconnect z wykładniczym backoffem i jitterem
+        self.reconnect_base_delay = 1.0
+        self.reconnect_max_delay = 30.0
+        self._reconnect_attempts = 0
+        self.queues = queues if queues is not None else []
         self.main_loop = main_loop
-
-    def on_message(self, ws, message):
-        # Forward do wszystkich kolejek jeśli dostępne
-        if self.queues and self.main_loop:
-            for queue in self.queues:
-                if queue:
-                    self.main_loop.call_soon_threadsafe(queue.put_nowait, message)
-        else:
-            data = json.loads(message)
-            logger.debug("WS MESSAGE: %s", data)
-
-    def on_error(self, ws, error):
-        logger.error("WS ERROR: %s", error)
-
-    def on_close(self, ws, close_status_code, close_msg):
-        logger.info("WS CLOSED: code=%s msg=%s", close_status_code, close_msg)
-        if self.should_reconnect:
-            logger.info("Reconnecting websocket")
-            self.connect()
-
-    def on_open(self, ws):
-        logger.info("WS OPENED")
+        self.raw = raw
+        # stream name -> queue receiving only that stream's frames
+        self.stream_queues = stream_queues if stream_queues is not None else {}
+        self._task = None
+        self._ws = None
+        self._dropped = 0
+        # "deflate" negotiates permessage-deflate; off by default since most
+        # frames are small and inflating them costs more CPU than it saves
+        self.compression = "deflate" if WS_COMPRESSION else None
 
     def connect(self):
-        self.threads = []
-        self.ws_apps = []
-        if self.env == "testnet":
-            # Testnet: osobne połączenie dla każdego streamu
-            for stream in self.streams:
-                url = f"{self.ws_url}/ws/{stream}"
-                logger.debug("[BinanceWebSocketClient] Testnet: connecting to %s", url)
-                ws_app = websocket.WebSocketApp(
+        """Schedule the reader task; must be called from the loop's thread"""
+        loop = self.main_loop or asyncio.get_running_loop()
+        self._task = loop.create_task(self._run())
+        return self._task
+
+    async def _run(self):
+        while self.should_reconnect:
+            url = self._combined_url
+            try:
+                logger.debug("[BinanceWebSocketClient] %s: connecting to %s", self.env, url)
+                async with websockets.connect(
                     url,
-                    on_message=self.on_message,
-                    on_error=self.on_error,
-                    on_close=self.on_close,
-                    on_open=self.on_open
-                )
-                thread = threading.Thread(target=ws_app.run_forever)
-                thread.daemon = True
-                thread.start()
-                self.threads.append(thread)
-                self.ws_apps.append(ws_app)
-        else:
-            # Produkcja: jedno połączenie multi-stream
-            url = f"{self.ws_url}/stream?streams={'/'.join(self.streams)}"
-            logger.debug("[BinanceWebSocketClient] Prod: connecting to %s", url)
-            ws_app = websocket.WebSocketApp(
-                url,
-                on_message=self.on_message,
-                on_error=self.on_error,
-                on_close=self.on_close,
-                on_open=self.on_open
-            )
-            thread = threading.Thread(target=ws_app.run_forever)
-            thread.daemon = True
-            thread.start()
-            self.threads.append(thread)
-            self.ws_apps.append(ws_app)
+                    ssl=_WS_SSL_CONTEXT if url.startswith("wss://") else None,
+                    compression=self.compression,
+                    max_size=2 ** 20,
+                    ping_interval=20,
+                    ping_timeout=10,
+                ) as ws:
+                    logger.info("WS OPENED")
+                    self._reconnect_attempts = 0
+                    self._ws = ws
+                    try:
+                        # decode=False: text frames come as bytes, which orjson
+                        # parses directly - no UTF-8 decode to str and back
+                        while True:
+                            self._forward(await ws.recv(decode=False))
+                    except websockets.ConnectionClosedOK:
+                        pass
+                    finally:
+                        self._ws = None
+                logger.info("WS CLOSED")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("WS ERROR: %s", e)
+            if self.should_reconnect:
+                delay = min(
+                    self.reconnect_max_delay,
+                    self.reconnect_base_delay * 2 ** self._reconnect_attempts,
+                ) + random.uniform(0, 0.5)
+                self._reconnect_attempts += 1
+                logger.info("Reconnecting websocket in %.1fs", delay)
+                await asyncio.sleep(delay)
+
+    def _forward(self, message):
+        queues = self.queues
+        if self.stream_queues:
+            # Routing po nazwie streamu odczytanej z prefiksu ramki - payload
+            # nie jest parsowany, jeśli nikt nie słucha danego streamu
+            routed = self.stream_queues.get(_stream_name(message))
+            if routed is not None:
+                queues = [*queues, routed]
+        if not queues:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("WS MESSAGE: %s", _json_loads(message))
+            return
+        if not self.raw:
+            message = _decode_frame(message)
+            if message is None:
+                return
+        for queue in queues:
+            if not queue:
+                continue
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Stary tick jest bezwartościowy: wyrzuć najstarszy, wstaw najnowszy
+                queue.get_nowait()
+                queue.put_nowait(message)
+                self._dropped += 1
+                if self._dropped % _DROP_LOG_EVERY == 1:
+                    logger.warning("WS queue full, dropped %d oldest messages so far", self._dropped)
+
+    async def subscribe(self, streams):
+        """Add streams on the open connection instead of reconnecting"""
+        added = tuple(s for s in streams if s not in self.streams)
+        if added:
+            self._set_streams(self.streams + added)
+            await self._send_control("SUBSCRIBE", added)
+
+    async def unsubscribe(self, streams):
+        """Drop streams from the open connection instead of reconnecting"""
+        removed = tuple(s for s in streams if s in self.streams)
+        if removed:
+            self._set_streams(s for s in self.streams if s not in removed)
+            await self._send_control("UNSUBSCRIBE", removed)
+
+    def _set_streams(self, streams):
+        self.streams = tuple(streams)
+        self._combined_url = _combined_stream_url(self.ws_url, self.streams)
+
+    async def _send_control(self, method, streams):
+        self._control_id += 1
+        if self._ws is not None:
+            await self._ws.send(_control_frame(method, streams, self._control_id))
 
     def close(self):
         self.should_reconnect = False
-        for ws in self.ws_apps:
-            ws.close()
+        if self._task and not self._task.done():
+            self._task.cancel()
+
+
+# Dawna nazwa klasy asyncio - zachowana dla istniejących importów
+BinanceAsyncWebSocketClient = BinanceWebSocketClient
 
 
 class BinanceClient(BinanceRESTClient):
     """Enhanced Binance client with both REST and WebSocket support."""
 
+    __slots__ = ("ws_client", "_http", "_inflight")
+
     def __init__(self):
         super().__init__()
         self.ws_client = None
+        # Native async HTTP client: requests run on the event loop itself
+        # instead of hopping to a worker thread, sharing pooled connections
+        self._http = httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            headers=self._headers(),
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        # key -> Task of the request currently in flight (single-flight)
+        self._inflight = {}
+
+    async def _request_async(self, method, url, body=None):
+        # body is an already signed, urlencoded form string
+        headers = _FORM_HEADERS if body is not None else None
+        resp = await self._http.request(method, url, content=body, headers=headers)
+        resp.raise_for_status()
+        return _decode(resp)
+
+    async def _single_flight(self, key, fetch):
+        """Run fetch() once for all concurrent callers asking for the same key"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: one caller being cancelled must not cancel the shared request
+        return await asyncio.shield(task)
 
     async def initialize(self):
         """Initialize the client (placeholder for async initialization)"""
@@ -468,111 +909,191 @@ class BinanceClient(BinanceRESTClient):
         """Close the client and clean up resources"""
         if self.ws_client:
             self.ws_client.close()
+        self.close_session()
+        await self._http.aclose()
+
+    async def _cached_request_async(self, url, ttl):
+        """Async counterpart of _cached_get sharing the same response cache"""
+        cached = self._cached_response(url)
+        if cached is not None:
+            return cached
+        return await self._single_flight(url, lambda: self._fetch_and_store(url, ttl))
+
+    async def _fetch_and_store(self, url, ttl):
+        return self._store_response(url, await self._request_async("GET", url), ttl)
 
     async def get_ticker(self, symbol):
-        """Async wrapper for get_ticker using thread executor"""
-        import asyncio
+        """Async get_ticker over the shared async HTTP client"""
         try:
-            result = await asyncio.to_thread(super().get_ticker, symbol)
-            return result
+            return await self._cached_request_async(self._ticker_url(symbol), _TICKER_TTL)
         except Exception as e:
             logger.error("[ERROR] get_ticker failed for %s: %s", symbol, e)
             return None
 
     async def get_ticker_24hr(self, symbol):
-        """Async wrapper for get_ticker_24hr with changePercent data"""
-        import asyncio
+        """Async get_ticker_24hr with changePercent data"""
         try:
-            result = await asyncio.to_thread(super().get_ticker_24hr, symbol)
-            return result
+            cached = self._ticker_24hr_from_all(symbol)
+            if cached is not None:
+                return cached
+            return await self._cached_request_async(self._ticker_24hr_url(symbol), _TICKER_24HR_TTL)
         except Exception as e:
             logger.error("[ERROR] get_ticker_24hr failed for %s: %s", symbol, e)
             return None
 
     async def get_exchange_info_async(self):
-        """Async wrapper for get_exchange_info"""
-        import asyncio
+        """Async get_exchange_info sharing the sync method's cache"""
         try:
-            result = await asyncio.to_thread(super().get_exchange_info)
-            return result
+            cached = self._cached_exchange_info()
+            if cached is not None:
+                return cached
+            return await self._single_flight("exchangeInfo", self._fetch_exchange_info_async)
         except Exception as e:
             logger.error("[ERROR] get_exchange_info failed: %s", e)
             return None
 
     async def get_ticker_24hr_all_async(self):
-        """Async wrapper for get_ticker_24hr_all"""
-        import asyncio
+        """Async get_ticker_24hr_all sharing the sync method's cache"""
         try:
-            result = await asyncio.to_thread(super().get_ticker_24hr_all)
-            return result
+            cached = self._cached_ticker_24hr_all()
+            if cached is not None:
+                return cached
+            return await self._single_flight("ticker24hrAll", self._fetch_ticker_24hr_all_async)
         except Exception as e:
             logger.error("[ERROR] get_ticker_24hr_all failed: %s", e)
             return None
 
+    async def _fetch_exchange_info_async(self):
+        return self._store_exchange_info(await self._request_async("GET", self._exchange_info_url()))
+
+    async def _fetch_ticker_24hr_all_async(self):
+        return self._store_ticker_24hr_all(await self._request_async("GET", self._ticker_24hr_url()))
+
+    async def get_klines_async(self, symbol, interval="1m", limit=100):
+        """Async get_klines sharing the sync method's response cache"""
+        try:
+            url = f"{self._klines_endpoint}?{_symbol_query(symbol, interval=interval, limit=limit)}"
+            return await self._cached_request_async(url, _KLINES_TTL)
+        except Exception as e:
+            logger.error("[ERROR] get_klines failed for %s: %s", symbol, e)
+            return None
+
+    # --- Batch helpers: concurrent requests multiplexed over the pooled client ---
+    async def get_tickers(self, symbols):
+        """Prices for many symbols, in input order (None where unavailable)"""
+        symbols = [_sym(s) for s in symbols]
+        if len(symbols) <= _BATCH_ALL_THRESHOLD:
+            return list(await asyncio.gather(*(self.get_ticker(s) for s in symbols)))
+        try:
+            prices = await self._cached_request_async(self._price_endpoint, _TICKER_TTL)
+        except Exception as e:
+            logger.error("[ERROR] get_tickers failed: %s", e)
+            return [None] * len(symbols)
+        by_symbol = {t["symbol"]: t for t in prices}
+        return [by_symbol.get(s) for s in symbols]
+
+    async def get_klines_batch(self, symbols, interval="1m", limit=100):
+        return list(await asyncio.gather(*(self.get_klines_async(s, interval, limit) for s in symbols)))
+
+    async def get_order_statuses(self, orders):
+        """Status for many (symbol, order_id) pairs, in input order"""
+        return list(await asyncio.gather(
+            *(self.get_order_status_async(symbol, order_id) for symbol, order_id in orders)
+        ))
+
+    async def place_orders_async(self, orders):
+        """Place a burst of orders concurrently, results in input order
+
+        Each item holds place_order_async keyword arguments. Spot REST has no
+        batch order endpoint, so the orders are signed individually and sent
+        as concurrent streams over the pooled (HTTP/2) connection.
+        """
+        return list(await asyncio.gather(*(self.place_order_async(**order) for order in orders)))
+
     async def get_order_book(self, symbol, limit=20):
-        """Async wrapper for get_orderbook using thread executor"""
-        import asyncio
+        """Async get_orderbook over the shared async HTTP client"""
         try:
-            result = await asyncio.to_thread(super().get_orderbook, symbol, limit)
-            return result
+            return await self._request_async("GET", self._orderbook_url(symbol, limit))
         except Exception as e:
             logger.error("[ERROR] get_order_book failed for %s: %s", symbol, e)
             return None
 
     async def get_account_info_async(self):
-        """Async wrapper for get_account_info"""
-        import asyncio
+        """Async get_account_info sharing the sync method's cache"""
         try:
-            result = await asyncio.to_thread(super().get_account_info)
-            return result
+            cached = self._cached_account_info()
+            if cached is not None:
+                return cached
+            return await self._single_flight("account", self._fetch_account_info_async)
         except Exception as e:
             logger.error("[ERROR] get_account_info failed: %s", e)
             return None
 
+    async def _fetch_account_info_async(self):
+        generation = self._account_info_generation
+        data = await self._request_async("GET", self._account_info_url())
+        return self._store_account_info(data, generation)
+
     async def get_open_orders_async(self, symbol=None):
-        """Async wrapper for get_open_orders"""
-        import asyncio
+        """Async get_open_orders over the shared async HTTP client"""
         try:
-            result = await asyncio.to_thread(super().get_open_orders, symbol)
-            return result
+            # Signed URL differs per call (timestamp), so key on the symbol
+            return await self._single_flight(
+                f"openOrders:{symbol}",
+                lambda: self._request_async("GET", self._open_orders_url(symbol)),
+            )
         except Exception as e:
             logger.error("[ERROR] get_open_orders failed for %s: %s", symbol, e)
             return None
 
     async def get_all_orders_async(self, symbol, limit=500, order_id=None, start_time=None, end_time=None):
-        """Async wrapper for get_all_orders"""
-        import asyncio
+        """Async get_all_orders over the shared async HTTP client"""
         try:
-            result = await asyncio.to_thread(super().get_all_orders, symbol, limit, order_id, start_time, end_time)
-            return result
+            url = self._all_orders_url(symbol, limit, order_id, start_time, end_time)
+            return await self._request_async("GET", url)
+        except Exception as e:
+            logger.error("[ERROR] get_all_orders failed for %s: %s", symbol, e)
+            return None
+
+    async def get_all_orders_raw_async(self, symbol, limit=500, order_id=None, start_time=None, end_time=None):
+        """get_all_orders_async returning the undecoded JSON body (bytes)
+
+        Up to 1000 orders that are only passed through to the frontend do not
+        need to be parsed into dicts and serialised again.
+        """
+        try:
+            url = self._all_orders_url(symbol, limit, order_id, start_time, end_time)
+            resp = await self._http.get(url)
+            resp.raise_for_status()
+            return resp.content
         except Exception as e:
             logger.error("[ERROR] get_all_orders failed for %s: %s", symbol, e)
             return None
 
     async def get_order_status_async(self, symbol, order_id=None, orig_client_order_id=None):
-        """Async wrapper for get_order_status"""
-        import asyncio
+        """Async get_order_status over the shared async HTTP client"""
         try:
-            result = await asyncio.to_thread(super().get_order_status, symbol, order_id, orig_client_order_id)
-            return result
+            url = self._order_status_url(symbol, order_id, orig_client_order_id)
+            return await self._request_async("GET", url)
         except Exception as e:
             logger.error("[ERROR] get_order_status failed for %s, orderId: %s: %s", symbol, order_id, e)
             return None
 
     async def place_order_async(self, symbol, side, order_type, quantity, price=None, time_in_force="GTC"):
-        """Async wrapper for place_order"""
-        import asyncio
+        """Async place_order over the shared async HTTP client"""
         try:
-            result = await asyncio.to_thread(super().place_order, symbol, side, order_type, quantity, price, time_in_force)
-            return result
+            body = self._order_body(symbol, side, order_type, quantity, price, time_in_force)
+            logger.debug("Placing order: symbol=%s side=%s type=%s", symbol, side, order_type)
+            resp = await self._http.post(self._order_endpoint, content=body, headers=_FORM_HEADERS)
+            self.invalidate_account_cache()
+            return self._check_order_response(resp)
         except Exception as e:
             # Spróbuj wyciągnąć szczegóły HTTPError (code/msg Binance)
             detail = {'error': str(e)}
             try:
-                import requests
-                if isinstance(e, requests.HTTPError) and e.response is not None:
+                if isinstance(e, httpx.HTTPStatusError) and e.response is not None:
                     try:
-                        j = e.response.json()
+                        j = _decode(e.response)
                         if isinstance(j, dict):
                             # Rozszerz szczegóły błędu
                             detail['binanceCode'] = str(j.get('code')) if 'code' in j else None  # type: ignore
@@ -581,53 +1102,49 @@ class BinanceClient(BinanceRESTClient):
                     except Exception:
                         detail['responseText'] = e.response.text[:500]
             except Exception as ex:
-                logging.getLogger(__name__).warning(f"Failed to extract response details from order error: {ex}")
+                logger.warning("Failed to extract response details from order error: %s", ex)
             logger.error("[ERROR] place_order failed for %s: %s", symbol, detail)
             return detail
 
     async def test_order_async(self, symbol, side, order_type, quantity, price=None, time_in_force="GTC"):
-        """Async wrapper for test_order"""
-        import asyncio
+        """Async test_order over the shared async HTTP client"""
         try:
-            result = await asyncio.to_thread(super().test_order, symbol, side, order_type, quantity, price, time_in_force)
-            return result
+            body = self._order_body(symbol, side, order_type, quantity, price, time_in_force)
+            return await self._request_async("POST", self._order_test_endpoint, body)
         except Exception as e:
             logger.error("[ERROR] test_order failed for %s: %s", symbol, e)
             return None
 
     async def cancel_order_async(self, symbol, order_id=None, orig_client_order_id=None):
-        """Async wrapper for cancel_order"""
-        import asyncio
+        """Async cancel_order over the shared async HTTP client"""
         try:
-            result = await asyncio.to_thread(super().cancel_order, symbol, order_id, orig_client_order_id)
+            body = self._cancel_body(symbol, order_id, orig_client_order_id)
+            result = await self._request_async("DELETE", self._order_endpoint, body)
+            self.invalidate_account_cache()
             return result
         except Exception as e:
             logger.error("[ERROR] cancel_order failed for %s, orderId: %s: %s", symbol, order_id, e)
             return None
 
-    # --- Async wrappers for user data stream ---
+    # --- Async user data stream management ---
     async def start_user_data_stream_async(self):
-        import asyncio
         try:
-            result = await asyncio.to_thread(super().start_user_data_stream)
-            return result
+            return await self._request_async("POST", self._user_data_stream_url())
         except Exception as e:
             logger.error("[ERROR] start_user_data_stream failed: %s", e)
             return None
 
     async def keepalive_user_data_stream_async(self, listen_key: str):
-        import asyncio
         try:
-            await asyncio.to_thread(super().keepalive_user_data_stream, listen_key)
+            await self._request_async("PUT", self._user_data_stream_url(listen_key))
             return True
         except Exception as e:
             logger.error("[ERROR] keepalive_user_data_stream failed: %s", e)
             return False
 
     async def close_user_data_stream_async(self, listen_key: str):
-        import asyncio
         try:
-            await asyncio.to_thread(super().close_user_data_stream, listen_key)
+            await self._request_async("DELETE", self._user_data_stream_url(listen_key))
             return True
         except Exception as e:
             logger.error("[ERROR] close_user_data_stream failed: %s", e)
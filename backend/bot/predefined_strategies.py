@@ -7,7 +7,9 @@ Każda strategia zawiera:
 - Kompletną konfigurację z parametrami i risk management
 """
 
-from typing import Dict, Any, List
+import copy
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
 
 PREDEFINED_STRATEGIES = {
@@ -108,6 +110,47 @@ PREDEFINED_STRATEGIES = {
     }
 }
 
+# Metadata UI liczone raz przy imporcie - PREDEFINED_STRATEGIES nie zmienia się
+# w trakcie działania. Tagi jako krotki, a wywołujący dostają kopie
+# (_metadata_copy), więc cache nie może zostać zmodyfikowany z zewnątrz.
+_METADATA_CACHE = {
+    key: {
+        "name": strategy["name"],
+        "description": strategy["description"],
+        "emoji": strategy["emoji"],
+        "tags": tuple(strategy["tags"])
+    }
+    for key, strategy in PREDEFINED_STRATEGIES.items()
+}
+
+
+def _metadata_copy(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Shallow copy of a cached metadata entry with its own tags list"""
+    return {**metadata, "tags": list(metadata["tags"])}
+
+# Pola wymagane przez validate_strategy_config
+_REQUIRED_FIELDS = frozenset(("type", "symbol", "timeframe", "parameters", "risk_management"))
+_REQUIRED_RISK_FIELDS = frozenset(
+    ("max_position_size", "stop_loss_pct", "take_profit_pct", "max_daily_trades", "max_daily_loss")
+)
+
+
+def _freeze(obj):
+    """Deep read-only copy: dicts become MappingProxyType, lists become tuples"""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+# Zamrożone (także zagnieżdżone parameters/risk_management) widoki konfiguracji,
+# współdzielone bez kopiowania przy każdym odczycie
+_CONFIG_VIEW = {
+    key: _freeze(strategy["config"])
+    for key, strategy in PREDEFINED_STRATEGIES.items()
+}
+
 
 def get_predefined_strategies() -> Dict[str, Dict[str, Any]]:
     """
@@ -116,15 +159,7 @@ def get_predefined_strategies() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dict with strategy keys and their UI metadata (name, description, emoji, tags)
     """
-    return {
-        key: {
-            "name": strategy["name"],
-            "description": strategy["description"], 
-            "emoji": strategy["emoji"],
-            "tags": strategy["tags"]
-        }
-        for key, strategy in PREDEFINED_STRATEGIES.items()
-    }
+    return {key: _metadata_copy(metadata) for key, metadata in _METADATA_CACHE.items()}
 
 
 def get_strategy_config(strategy_key: str) -> Dict[str, Any]:
@@ -140,11 +175,34 @@ def get_strategy_config(strategy_key: str) -> Dict[str, Any]:
     Raises:
         ValueError: If strategy_key not found
     """
-    if strategy_key not in PREDEFINED_STRATEGIES:
+    try:
+        strategy = PREDEFINED_STRATEGIES[strategy_key]
+    except KeyError:
         available = list(PREDEFINED_STRATEGIES.keys())
-        raise ValueError(f"Unknown strategy: {strategy_key}. Available: {available}")
+        raise ValueError(f"Unknown strategy: {strategy_key}. Available: {available}") from None
     
-    return PREDEFINED_STRATEGIES[strategy_key]["config"].copy()
+    # Deep copy: parameters/risk_management are nested and the caller may modify them
+    return copy.deepcopy(strategy["config"])
+
+
+def get_strategy_config_readonly(strategy_key: str) -> Mapping[str, Any]:
+    """
+    Pobierz konfigurację strategii tylko do odczytu (bez kopiowania)
+
+    Args:
+        strategy_key: Key strategii z PREDEFINED_STRATEGIES
+
+    Returns:
+        Read-only view of the strategy configuration
+
+    Raises:
+        ValueError: If strategy_key not found
+    """
+    try:
+        return _CONFIG_VIEW[strategy_key]
+    except KeyError:
+        available = list(PREDEFINED_STRATEGIES.keys())
+        raise ValueError(f"Unknown strategy: {strategy_key}. Available: {available}") from None
 
 
 def get_strategy_metadata(strategy_key: str) -> Dict[str, Any]:
@@ -157,16 +215,10 @@ def get_strategy_metadata(strategy_key: str) -> Dict[str, Any]:
     Returns:
         Strategy metadata (name, description, emoji, tags)
     """
-    if strategy_key not in PREDEFINED_STRATEGIES:
-        raise ValueError(f"Unknown strategy: {strategy_key}")
-    
-    strategy = PREDEFINED_STRATEGIES[strategy_key]
-    return {
-        "name": strategy["name"],
-        "description": strategy["description"],
-        "emoji": strategy["emoji"], 
-        "tags": strategy["tags"]
-    }
+    try:
+        return _metadata_copy(_METADATA_CACHE[strategy_key])
+    except KeyError:
+        raise ValueError(f"Unknown strategy: {strategy_key}") from None
 
 
 def list_strategy_keys() -> List[str]:
@@ -184,29 +236,20 @@ def validate_strategy_config(config: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ["type", "symbol", "timeframe", "parameters", "risk_management"]
-    
     try:
         # Check required top-level fields
-        for field in required_fields:
-            if field not in config:
-                return False
-        
-        # Check risk management fields
-        risk_fields = ["max_position_size", "stop_loss_pct", "take_profit_pct", "max_daily_trades", "max_daily_loss"]
-        for field in risk_fields:
-            if field not in config["risk_management"]:
-                return False
-        
-        # Basic type validation
-        if not isinstance(config["parameters"], dict):
+        if not _REQUIRED_FIELDS.issubset(config):
             return False
-            
-        if not isinstance(config["risk_management"], dict):
+
+        # Basic type validation
+        risk_management = config["risk_management"]
+        if not isinstance(config["parameters"], dict) or not isinstance(risk_management, dict):
             return False
-            
-        return True
-    except (KeyError, TypeError):
+
+        # Check risk management fields
+        return _REQUIRED_RISK_FIELDS.issubset(risk_management)
+    except TypeError:
+        # config is not a mapping
         return False
 
 
@@ -215,6 +258,7 @@ __all__ = [
     "PREDEFINED_STRATEGIES",
     "get_predefined_strategies", 
     "get_strategy_config",
+    "get_strategy_config_readonly",
     "get_strategy_metadata",
     "list_strategy_keys",
     "validate_strategy_config"
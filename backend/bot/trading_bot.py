@@ -4,21 +4,119 @@ import threading
 import time
 import json
 import logging
+from collections import deque
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+try:
+    # uvloop nie działa na Windows - requirements.txt instaluje go tylko poza win32
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:  # pragma: no cover - uvloop is optional
+    _new_event_loop = asyncio.new_event_loop
 
 # Module logger
 logger = logging.getLogger(__name__)
 
 
+# (sekunda, sformatowany czas) - time.ctime() ma rozdzielczość 1 s
+_ctime_cache = (0, "")
+
+
+def _ctime():
+    """time.ctime(), formatted at most once per second"""
+    global _ctime_cache
+    now = int(time.time())
+    if now != _ctime_cache[0]:
+        _ctime_cache = (now, time.ctime(now))
+    return _ctime_cache[1]
+
+
+def _coalesce_key(market_data):
+    """(event type, symbol) of a parsed tick; None for a closed kline, which is never dropped"""
+    if not isinstance(market_data, dict):
+        return (None, None)  # surowe str/bytes - bez parsowania
+    event_type = market_data.get('e')
+    if event_type == 'kline' and (market_data.get('k') or {}).get('x', False):
+        return None
+    return (event_type, market_data.get('s'))
+
+
+def _running_loop():
+    """Event loop running in the current thread, or None"""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
 class TradingBot:
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "running",
+        "status",
+        "logs",
+        "thread",
+        "loop",
+        "last_tick_ns",
+        "orders",
+        "strategy_name",
+        "symbol",
+        "strategy",
+        "broadcast_callback",
+        "market_data_queue",
+        "main_loop",
+        "_task",
+        "_log_outbox",
+        "_pending_logs",
+        "_logs_wakeup",
+        "_event_handlers",
+        "_strategy_handlers",
+        "_last_broadcast_future",
+        "_status_pending",
+        "strategy_config",
+        "strategy_state",
+        "_ma_window",
+        "_ma_sum",
+    )
+
     def __init__(self, market_data_queue=None, broadcast_callback=None, main_loop=None):
         self.running = False
         self.status = "stopped"
-        self.logs = []
+        self.logs = deque(maxlen=20)  # tylko ostatnie 20 logów, pamięć ograniczona
         self.thread = None
         self.loop = None
-        self.last_tick = None
+        self._task = None  # task/future bota na głównym event loopie
+        # Logi czekające na wysłanie; jedna paczka (jedna ramka WS) na serię
+        self._log_outbox = []
+        # Logi z wątku bota: deque (append jest thread-safe) i jedno wybudzenie
+        # głównego loopa na serię zamiast call_soon_threadsafe na każdy log
+        self._pending_logs = deque()
+        self._logs_wakeup = False
+        self._status_pending = False  # bot_status już zaplanowany na głównym loopie
+        # event type Binance -> handler (jedno wyszukanie zamiast łańcucha if/elif)
+        self._event_handlers = {
+            '24hrTicker': self._handle_ticker,
+            'depthUpdate': self._handle_depth,
+            'kline': self._handle_kline,
+        }
+        # strategy_config["type"] -> metoda strategii
+        self._strategy_handlers = {
+            "simple_ma": self._simple_ma_strategy,
+            "rsi": self._rsi_strategy,
+            "grid": self._grid_strategy,
+            "dca": self._dca_strategy,
+        }
+        self.last_tick_ns = None  # time.time_ns() ostatniego ticka; formatowany leniwie
         self.orders = []
         self.strategy_name = "test_strategy"
+        # Ustawiane przez komendę start_bot z /ws/bot
+        self.symbol = None
+        self.strategy = None
         self.broadcast_callback = broadcast_callback  # Callback do wysyłania przez WebSocket
         self.market_data_queue = market_data_queue  # Queue z live market data
         self.main_loop = main_loop  # Główny event loop FastAPI
@@ -64,83 +162,139 @@ class TradingBot:
             "grid_orders": [],
             "last_dca_time": 0,
         }
+        # Okno SMA z bieżącą sumą - średnia w O(1) na tick
+        self._ma_window = deque(maxlen=self.strategy_config["parameters"]["ma_period"])
+        self._ma_sum = 0.0
 
     def start(self):
         if not self.running:
             self.running = True
             self.status = "running"
-            self._add_log(f"Bot started at {time.ctime()}")
+            self._add_log(f"Bot started at {_ctime()}")
             self._broadcast_status()
-            self.thread = threading.Thread(target=self._run_async_loop)
-            self.thread.start()
+            loop = _running_loop()
+            if loop is not None:
+                # Bot jako task na głównym loopie - bez osobnego wątku i drugiego loopa
+                self._task = loop.create_task(self.run())
+            elif self.main_loop is not None and self.main_loop.is_running():
+                self._task = asyncio.run_coroutine_threadsafe(self.run(), self.main_loop)
+            else:
+                # Brak event loopa (skrypty, testy) - własny wątek z nowym loopem.
+                # Task tworzymy od razu, żeby stop() mógł go anulować nawet
+                # zanim wątek wystartuje
+                self.loop = _new_event_loop()
+                self._task = self.loop.create_task(self.run())
+                self.thread = threading.Thread(target=self._run_async_loop, args=(self._task,))
+                self.thread.start()
 
     def stop(self):
         if self.running:
             self.running = False
             self.status = "stopped"
-            self._add_log(f"Bot stopped at {time.ctime()}")
+            self._add_log(f"Bot stopped at {_ctime()}")
             self._broadcast_status()
+            if self._task is not None:
+                if self.thread is not None:
+                    # Task żyje na loopie wątku bota - anulujemy go z tamtego wątku
+                    try:
+                        self.loop.call_soon_threadsafe(self._task.cancel)
+                    except RuntimeError:
+                        pass  # wątek już się zakończył i zamknął loop
+                else:
+                    self._task.cancel()
+                self._task = None
             if self.thread:
                 self.thread.join(timeout=1)
+                self.thread = None
 
     def _add_log(self, message):
         """Dodaj log i wyślij przez WebSocket jeśli dostępny"""
         self.logs.append(message)
-        logger = logging.getLogger(__name__)
         logger.debug("[TradingBot] %s", message)
 
-        if self.broadcast_callback and self.main_loop:
-            try:
-                # Używamy asyncio.run_coroutine_threadsafe zamiast call_soon_threadsafe
-                import asyncio
-                logger.debug("Broadcasting log via WebSocket: %s...", message[:50])
-                _broadcast_future = asyncio.run_coroutine_threadsafe(
-                    self.broadcast_callback({
-                        "type": "log",
-                        "message": message,
-                        "timestamp": time.ctime()
-                    }),
-                    self.main_loop
-                )
-                logger.debug("Broadcast future created successfully")
-                # Store future reference for monitoring if needed
-                self._last_broadcast_future = _broadcast_future
-            except Exception:
-                logger.exception("Error broadcasting log")
-        else:
-            logger.debug("No broadcast_callback or main_loop available")
+        # Bez WebSocketu (np. backtest) nie ma nic więcej do zrobienia
+        main_loop = self.main_loop
+        if self.broadcast_callback is None or main_loop is None:
+            return
+        try:
+            entry = {"message": message, "timestamp": _ctime()}
+            if _running_loop() is main_loop:
+                self._queue_log(entry)
+            else:
+                self._pending_logs.append(entry)
+                if not self._logs_wakeup:
+                    self._logs_wakeup = True
+                    main_loop.call_soon_threadsafe(self._drain_pending_logs)
+        except Exception:
+            self._logs_wakeup = False
+            logger.exception("Error broadcasting log")
+
+    def _drain_pending_logs(self):
+        """Move logs queued by the bot thread into the outbox; runs on the main loop"""
+        # Flaga przed opróżnieniem: log dodany w trakcie albo trafi tutaj,
+        # albo zaplanuje kolejne wybudzenie
+        self._logs_wakeup = False
+        pending = self._pending_logs
+        while pending:
+            self._queue_log(pending.popleft())
 
     def _broadcast_status(self):
         """Wyślij status przez WebSocket jeśli dostępny"""
-        if self.broadcast_callback and self.main_loop:
-            try:
-                # Używamy asyncio.run_coroutine_threadsafe zamiast call_soon_threadsafe
-                import asyncio
-                logger.debug("Broadcasting status via WebSocket")
-                _future = asyncio.run_coroutine_threadsafe(
-                    self.broadcast_callback({
-                        "type": "bot_status",
-                        "running": self.running,
-                        "status": {
-                            "running": self.running,
-                            **self.get_status()
-                        }
-                    }),
-                    self.main_loop
-                )
-                logger.debug("Status broadcast future created successfully")
-                # store ref for later inspection if needed
-                self._last_broadcast_future = _future
-                # Nie czekamy na future.result() żeby nie blokować
-            except Exception:
-                logger.exception("Error broadcasting status")
-        else:
-            logger.debug("No broadcast_callback or main_loop available for status")
-
-    def _run_async_loop(self):
-        self.loop = asyncio.new_event_loop()
+        main_loop = self.main_loop
+        if self.broadcast_callback is None or main_loop is None:
+            return
+        try:
+            if _running_loop() is main_loop:
+                self._queue_status()
+            else:
+                main_loop.call_soon_threadsafe(self._queue_status)
+        except Exception:
+            logger.exception("Error broadcasting status")
+
+    def _queue_status(self):
+        """Schedule one bot_status send; runs on the main loop"""
+        if not self._status_pending:
+            # Kolejne zmiany przed wysłaniem trafią do tej samej ramki
+            self._status_pending = True
+            self._last_broadcast_future = self.main_loop.create_task(self._flush_status())
+
+    async def _flush_status(self):
+        """Send the current status (built at send time, so it covers every change queued so far)"""
+        self._status_pending = False
+        logger.debug("Broadcasting status via WebSocket")
+        await self.broadcast_callback({
+            "type": "bot_status",
+            "running": self.running,
+            "status": {
+                "running": self.running,
+                **self.get_status()
+            }
+        })
+
+    def _queue_log(self, entry):
+        """Buffer a log entry for the broadcast; runs on the main loop"""
+        self._log_outbox.append(entry)
+        if len(self._log_outbox) == 1:
+            # Pierwszy log serii planuje flush; kolejne logi z tej samej
+            # iteracji loopa trafią do tej samej paczki
+            self._last_broadcast_future = self.main_loop.create_task(self._flush_logs())
+
+    async def _flush_logs(self):
+        """Send buffered logs: a single one as "log", a burst as one "log_batch" frame"""
+        batch, self._log_outbox = self._log_outbox, []
+        if len(batch) == 1:
+            await self.broadcast_callback({"type": "log", **batch[0]})
+        elif batch:
+            await self.broadcast_callback({"type": "log_batch", "items": batch})
+
+    def _run_async_loop(self, task):
         asyncio.set_event_loop(self.loop)
-        self.loop.run_until_complete(self.run())
+        try:
+            self.loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.loop.close()
 
     async def run(self):
         while self.running:
@@ -148,23 +302,53 @@ class TradingBot:
                 if self.market_data_queue:
                     # Event-driven: czekaj na prawdziwe market data
                     market_data = await self.market_data_queue.get()
-                    await self.on_tick(market_data)
+                    for market_data in self._latest_market_data(market_data):
+                        await self.on_tick(market_data)
                 else:
                     # Fallback: timer-based dla testów bez live data
                     await self.on_tick(None)
                     await asyncio.sleep(2)
             except Exception as e:
-                error_msg = f"[ERROR] {time.ctime()}: {str(e)}"
+                error_msg = f"[ERROR] {_ctime()}: {str(e)}"
                 self._add_log(error_msg)
 
+    @property
+    def last_tick(self):
+        """Time of the last tick as a ctime string (None before the first tick)"""
+        if self.last_tick_ns is None:
+            return None
+        return time.ctime(self.last_tick_ns // 1_000_000_000)
+
+    def _latest_market_data(self, first):
+        """Drain the queue, keeping only the newest event per (type, symbol)
+
+        If the strategy fell behind, older ticks of the same event type and
+        symbol are stale - only the latest one is worth acting on. Closed
+        klines are kept: each one triggers the strategy on its candle.
+        """
+        latest = {}
+        market_data = first
+        while True:
+            key = _coalesce_key(market_data)
+            if key is None:
+                # Zamknięta świeca zastępuje czekającą otwartą świecę tego symbolu
+                latest.pop(('kline', market_data.get('s')), None)
+                key = object()
+            latest[key] = market_data
+            try:
+                market_data = self.market_data_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+        return list(latest.values())
+
     async def on_tick(self, market_data=None):
         # Logika ticka: analizuj market data i wywołaj strategię
-        self.last_tick = time.ctime()
+        self.last_tick_ns = time.time_ns()
 
         if market_data:
             try:
                 # Parse market data z JSON
-                data = json.loads(market_data) if isinstance(market_data, str) else market_data
+                data = _json_loads(market_data) if isinstance(market_data, (str, bytes)) else market_data
 
                 # Binance WebSocket format: { "e": "event_type", "s": "symbol", ... }
                 event_type = data.get('e', 'unknown')
@@ -177,7 +361,7 @@ class TradingBot:
                 await self.execute_strategy(None)
         else:
             # Fallback: timer-based tick
-            self._add_log(f"Timer tick: {self.last_tick}")
+            self._add_log(f"Timer tick: {_ctime()}")
             await self.execute_strategy(None)
 
     async def execute_strategy(self, market_data=None):
@@ -185,42 +369,9 @@ class TradingBot:
         if market_data:
             # Analizuj prawdziwe market data - format Binance WebSocket
             event_type = market_data.get('e', 'unknown')
-
-            if event_type == '24hrTicker':
-                # Analiza ticker data (24h stats)
-                current_price = float(market_data.get('c', 0))
-                price_change_percent = float(market_data.get('P', 0))
-                volume = float(market_data.get('v', 0))
-
-                # Log price change for analysis
-                self._add_log(f"Price change: {price_change_percent:.2f}%, Volume: {volume:.2f}")
-
-                # Execute configured strategy
-                await self._execute_configured_strategy(current_price, market_data)
-
-            elif event_type == 'depthUpdate':
-                # Analiza order book
-                bids = market_data.get('b', [])
-                asks = market_data.get('a', [])
-
-                if bids and asks:
-                    best_bid = float(bids[0][0]) if bids[0] else 0
-                    best_ask = float(asks[0][0]) if asks[0] else 0
-                    spread = best_ask - best_bid
-                    self._add_log(f"OrderBook - Spread: ${spread:.2f}, Bid: ${best_bid:.2f}, Ask: ${best_ask:.2f}")
-
-            elif event_type == 'kline':
-                # Analiza świec (candles)
-                kline_data = market_data.get('k', {})
-                close_price = float(kline_data.get('c', 0))
-                volume = float(kline_data.get('v', 0))
-                is_closed = kline_data.get('x', False)
-
-                if is_closed:
-                    # Execute strategy on closed candle
-                    await self._execute_configured_strategy(close_price, market_data)
-                    self._add_log(f"Kline closed - Price: ${close_price:.2f}, Volume: {volume:.2f}")
-
+            handler = self._event_handlers.get(event_type)
+            if handler is not None:
+                await handler(market_data)
             else:
                 self._add_log(f"Unknown event type: {event_type}")
         else:
@@ -230,19 +381,50 @@ class TradingBot:
 
         # Tu można dodać obsługę zleceń, np. self.place_order(...)
 
+    async def _handle_ticker(self, market_data):
+        # Analiza ticker data (24h stats)
+        get = market_data.get
+        current_price = float(get('c', 0))
+        price_change_percent = float(get('P', 0))
+        volume = float(get('v', 0))
+
+        # Log price change for analysis
+        self._add_log(f"Price change: {price_change_percent:.2f}%, Volume: {volume:.2f}")
+
+        # Execute configured strategy
+        await self._execute_configured_strategy(current_price, market_data)
+
+    async def _handle_depth(self, market_data):
+        # Analiza order book
+        bids = market_data.get('b', [])
+        asks = market_data.get('a', [])
+
+        if bids and asks:
+            best_bid_level, best_ask_level = bids[0], asks[0]
+            best_bid = float(best_bid_level[0]) if best_bid_level else 0
+            best_ask = float(best_ask_level[0]) if best_ask_level else 0
+            spread = best_ask - best_bid
+            self._add_log(f"OrderBook - Spread: ${spread:.2f}, Bid: ${best_bid:.2f}, Ask: ${best_ask:.2f}")
+
+    async def _handle_kline(self, market_data):
+        # Analiza świec (candles)
+        kline_data = market_data.get('k') or {}
+        # Cena/wolumen parsujemy dopiero dla zamkniętej świecy
+        if kline_data.get('x', False):
+            close_price = float(kline_data.get('c', 0))
+            volume = float(kline_data.get('v', 0))
+            # Execute strategy on closed candle
+            await self._execute_configured_strategy(close_price, market_data)
+            self._add_log(f"Kline closed - Price: ${close_price:.2f}, Volume: {volume:.2f}")
+
     async def _execute_configured_strategy(self, current_price, market_data):
         """Execute the configured trading strategy"""
         strategy_type = self.strategy_config["type"]
 
         try:
-            if strategy_type == "simple_ma":
-                await self._simple_ma_strategy(current_price, market_data)
-            elif strategy_type == "rsi":
-                await self._rsi_strategy(current_price, market_data)
-            elif strategy_type == "grid":
-                await self._grid_strategy(current_price, market_data)
-            elif strategy_type == "dca":
-                await self._dca_strategy(current_price, market_data)
+            strategy = self._strategy_handlers.get(strategy_type)
+            if strategy is not None:
+                await strategy(current_price, market_data)
             else:
                 self._add_log(f"Unknown strategy type: {strategy_type}")
 
@@ -253,16 +435,19 @@ class TradingBot:
         """Simple Moving Average strategy"""
         ma_period = self.strategy_config["parameters"]["ma_period"]
 
-        # Update price history (simplified - in production use proper data storage)
-        if "price_history" not in self.strategy_state:
-            self.strategy_state["price_history"] = []
+        window = self._ma_window
+        if window.maxlen != ma_period:
+            # Zmiana okresu - nowe okno z ostatnimi cenami
+            window = self._ma_window = deque(window, maxlen=ma_period)
+            self._ma_sum = float(sum(window))
 
-        self.strategy_state["price_history"].append(current_price)
-        if len(self.strategy_state["price_history"]) > ma_period:
-            self.strategy_state["price_history"].pop(0)
+        if len(window) == ma_period:
+            self._ma_sum -= window[0]  # deque sam usunie najstarszą cenę
+        window.append(current_price)
+        self._ma_sum += current_price
 
-        if len(self.strategy_state["price_history"]) >= ma_period:
-            ma_value = sum(self.strategy_state["price_history"]) / ma_period
+        if len(window) == ma_period:
+            ma_value = self._ma_sum / ma_period
 
             # Trading signals
             if current_price > ma_value * 1.001 and self.strategy_state["position"]["side"] != "long":
@@ -281,44 +466,48 @@ class TradingBot:
         rsi_overbought = self.strategy_config["parameters"]["rsi_overbought"]
         rsi_oversold = self.strategy_config["parameters"]["rsi_oversold"]
 
-        # Simplified RSI calculation (in production use proper TA library)
-        if "rsi_data" not in self.strategy_state:
-            self.strategy_state["rsi_data"] = {"gains": [], "losses": []}
-
-        # Calculate price change
-        if "prev_price" in self.strategy_state:
-            change = current_price - self.strategy_state["prev_price"]
-            if change > 0:
-                self.strategy_state["rsi_data"]["gains"].append(change)
-                self.strategy_state["rsi_data"]["losses"].append(0)
-            else:
-                self.strategy_state["rsi_data"]["gains"].append(0)
-                self.strategy_state["rsi_data"]["losses"].append(abs(change))
+        # Wilder RSI: średnie aktualizowane rekurencyjnie, bez list i sum() na tick
+        rsi_data = self.strategy_state.get("rsi_data")
+        if rsi_data is None:
+            rsi_data = self.strategy_state["rsi_data"] = {"avg_gain": 0.0, "avg_loss": 0.0, "count": 0}
 
+        prev_price = self.strategy_state.get("prev_price")
         self.strategy_state["prev_price"] = current_price
+        if prev_price is None:
+            return
 
-        # Keep only last N periods
-        for key in ["gains", "losses"]:
-            if len(self.strategy_state["rsi_data"][key]) > rsi_period:
-                self.strategy_state["rsi_data"][key].pop(0)
+        change = current_price - prev_price
+        gain, loss = (change, 0.0) if change > 0 else (0.0, -change)
+        count = rsi_data["count"]
+        if count < rsi_period:
+            # Rozgrzewka - sumy z pierwszych N zmian, potem zwykła średnia
+            rsi_data["avg_gain"] += gain
+            rsi_data["avg_loss"] += loss
+            rsi_data["count"] = count = count + 1
+            if count < rsi_period:
+                return
+            rsi_data["avg_gain"] /= rsi_period
+            rsi_data["avg_loss"] /= rsi_period
+        else:
+            rsi_data["avg_gain"] = (rsi_data["avg_gain"] * (rsi_period - 1) + gain) / rsi_period
+            rsi_data["avg_loss"] = (rsi_data["avg_loss"] * (rsi_period - 1) + loss) / rsi_period
 
-        if len(self.strategy_state["rsi_data"]["gains"]) >= rsi_period:
-            avg_gain = sum(self.strategy_state["rsi_data"]["gains"]) / rsi_period
-            avg_loss = sum(self.strategy_state["rsi_data"]["losses"]) / rsi_period
+        avg_gain = rsi_data["avg_gain"]
+        avg_loss = rsi_data["avg_loss"]
 
-            if avg_loss != 0:
-                rs = avg_gain / avg_loss
-                rsi = 100 - (100 / (1 + rs))
+        if avg_loss != 0:
+            rs = avg_gain / avg_loss
+            rsi = 100 - (100 / (1 + rs))
 
-                if rsi < rsi_oversold and self.strategy_state["position"]["side"] != "long":
-                    signal = "BUY"
-                    self._add_log(f"RSI Strategy: {signal} signal - RSI: {rsi:.2f} < {rsi_oversold}")
-                    await self._execute_trade_signal(signal, current_price)
+            if rsi < rsi_oversold and self.strategy_state["position"]["side"] != "long":
+                signal = "BUY"
+                self._add_log(f"RSI Strategy: {signal} signal - RSI: {rsi:.2f} < {rsi_oversold}")
+                await self._execute_trade_signal(signal, current_price)
 
-                elif rsi > rsi_overbought and self.strategy_state["position"]["side"] != "short":
-                    signal = "SELL"
-                    self._add_log(f"RSI Strategy: {signal} signal - RSI: {rsi:.2f} > {rsi_overbought}")
-                    await self._execute_trade_signal(signal, current_price)
+            elif rsi > rsi_overbought and self.strategy_state["position"]["side"] != "short":
+                signal = "SELL"
+                self._add_log(f"RSI Strategy: {signal} signal - RSI: {rsi:.2f} > {rsi_overbought}")
+                await self._execute_trade_signal(signal, current_price)
 
     async def _grid_strategy(self, current_price, market_data):
         """Grid trading strategy"""
@@ -433,7 +622,7 @@ class TradingBot:
         }
 
     def get_logs(self):
-        return self.logs[-20:]  # ostatnie 20 logów
+        return list(self.logs)
 
     def update_strategy_config(self, new_config):
         """Update strategy configuration"""
@@ -461,6 +650,10 @@ class TradingBot:
                 "grid_orders": [],
                 "last_dca_time": 0,
             }
+            # Puste okno - _simple_ma_strategy dobuduje je przy pierwszym ticku
+            # (nie każda strategia ma ma_period)
+            self._ma_window = deque()
+            self._ma_sum = 0.0
 
             self._add_log(f"Strategy config updated: {self.strategy_name}")
             return True
@@ -508,3 +701,7 @@ class TradingBot:
                 }
             }
         }
+
+
+# Export for easy imports
+__all__ = ["TradingBot"]
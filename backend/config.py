@@ -12,6 +12,8 @@ BINANCE_API_SECRET = os.getenv("BINANCE_API_SECRET", "")
 ENV = os.getenv("ENV", "development")
 BINANCE_ENV = os.getenv("BINANCE_ENV", "testnet")
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "example_admin_token")
+# permessage-deflate na strumieniach rynkowych: mniej bajtów w sieci kosztem CPU
+WS_COMPRESSION = os.getenv("WS_COMPRESSION", "false").lower() in ("true", "1", "yes")
 
 # Dynamically import env-specific config module to avoid module-level imports after code
 import importlib
@@ -52,6 +54,7 @@ __all__ = [
     "ENV",
     "BINANCE_ENV",
     "ADMIN_TOKEN",
+    "WS_COMPRESSION",
     # dynamically populated constants below
     "BINANCE_API_URL",
     "BINANCE_WS_URL",
@@ -5,6 +5,7 @@ BINANCE_API_SECRET: str
 ENV: str
 BINANCE_ENV: str
 ADMIN_TOKEN: str
+WS_COMPRESSION: bool
 
 BINANCE_API_URL: str
 BINANCE_WS_URL: str
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from typing import Dict, List, Optional, Any
@@ -10,6 +10,19 @@ import os
 import json
 import websockets
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        # Ten sam kompaktowy format co WebSocket.send_json
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
 from backend.binance_client import BinanceClient, BinanceWebSocketClient
 from backend.ws_api_client import BinanceWSApiClient
 from backend.market_data_manager import MarketDataManager
@@ -467,12 +480,14 @@ class ConnectionManager:
         if not symbol:
             await self._broadcast_to_all_market(data)
             return
+        # Serializacja raz na broadcast, nie raz na połączenie
+        text = _json_dumps(data)
         disconnected = []
         sent_count = 0
         for connection in self.market_connections:
             try:
                 if symbol in self.get_client_subscriptions(connection):
-                    await connection.send_json(data)
+                    await connection.send_text(text)
                     sent_count += 1
                 else:
                     logger.debug(
@@ -488,10 +503,11 @@ class ConnectionManager:
             self.disconnect_market(conn)
 
     async def _broadcast_to_all_market(self, data: dict):
+        text = _json_dumps(data)
         disconnected = []
         for connection in self.market_connections:
             try:
-                await connection.send_json(data)
+                await connection.send_text(text)
             except Exception as e:
                 logger.warning(f"WS_MARKET: failed to send to market connection: {e}")
                 disconnected.append(connection)
@@ -501,10 +517,11 @@ class ConnectionManager:
     async def broadcast_to_bot(self, data: dict):
         if not self.bot_connections:
             return
+        text = _json_dumps(data)
         disconnected = []
         for connection in self.bot_connections:
             try:
-                await connection.send_json(data)
+                await connection.send_text(text)
             except Exception as e:
                 logger.warning(f"WS_BOT: failed to send to bot connection: {e}")
                 disconnected.append(connection)
@@ -514,10 +531,11 @@ class ConnectionManager:
     async def broadcast_to_user(self, data: dict):
         if not self.user_connections:
             return
+        text = _json_dumps(data)
         disconnected = []
         for connection in self.user_connections:
             try:
-                await connection.send_json(data)
+                await connection.send_text(text)
             except Exception as e:
                 logger.warning(f"WS_USER: failed to send to user connection: {e}")
                 disconnected.append(connection)
@@ -590,27 +608,32 @@ async def _user_stream_keepalive_loop():
     logger.info("USER_STREAM: keepalive loop started")
     try:
         while True:
-            await asyncio.sleep(5)
             if not _user_stream_listen_key or not binance_client:
+                await asyncio.sleep(5)
                 continue
             now = asyncio.get_event_loop().time()
-            if (
-                _user_stream_last_keepalive is None
-                or now - _user_stream_last_keepalive > _USER_STREAM_KEEPALIVE_INTERVAL
-            ):
-                try:
-                    ok = await binance_client.keepalive_user_data_stream_async(_user_stream_listen_key)
-                    if ok:
-                        _user_stream_last_keepalive = now
-                        logger.debug("USER_STREAM: keepalive sent")
-                    else:
-                        _user_stream_keepalive_errors += 1
-                        _user_stream_restarts += 1
-                        logger.warning("USER_STREAM: keepalive returned False – forcing restart")
-                        await _start_user_stream(force=True)
-                except Exception as e:
+            # Śpij do terminu następnego keepalive zamiast budzić się co 5 s;
+            # restart streamu przesuwa termin, więc po przebudzeniu liczymy od nowa
+            if _user_stream_last_keepalive is not None:
+                wait = _user_stream_last_keepalive + _USER_STREAM_KEEPALIVE_INTERVAL - now
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+            try:
+                ok = await binance_client.keepalive_user_data_stream_async(_user_stream_listen_key)
+                if ok:
+                    _user_stream_last_keepalive = now
+                    logger.debug("USER_STREAM: keepalive sent")
+                else:
                     _user_stream_keepalive_errors += 1
-                    logger.error(f"USER_STREAM: keepalive error: {e}")
+                    _user_stream_restarts += 1
+                    logger.warning("USER_STREAM: keepalive returned False – forcing restart")
+                    await _start_user_stream(force=True)
+            except Exception as e:
+                _user_stream_keepalive_errors += 1
+                logger.error(f"USER_STREAM: keepalive error: {e}")
+                # Termin nie został przesunięty - ponów po krótkiej przerwie
+                await asyncio.sleep(5)
     except asyncio.CancelledError:
         logger.info("USER_STREAM: keepalive loop cancelled")
     finally:
@@ -692,6 +715,7 @@ async def lifespan(app: FastAPI):
             WS_API_MAX_RETRIES,
             BINANCE_WS_URL,
             BINANCE_ENV,
+            WS_COMPRESSION,
         )
         if ENABLE_WS_API and BINANCE_API_KEY and BINANCE_API_SECRET:
             logger.info("🌐 BINANCE_WS_API: initializing...")
@@ -717,7 +741,8 @@ async def lifespan(app: FastAPI):
         market_data_manager = MarketDataManager(
             ws_url=BINANCE_WS_URL,
             env=BINANCE_ENV,
-            main_loop=asyncio.get_event_loop()
+            main_loop=asyncio.get_event_loop(),
+            compression="deflate" if WS_COMPRESSION else None
         )
 
         # Add message handler for processing market data
@@ -734,10 +759,17 @@ async def lifespan(app: FastAPI):
                         "symbol": symbol,
                         "timestamp": message.get("timestamp")
                     }
-                    # Put in queue for compatibility with existing broadcaster
+                    # Put in queue for compatibility with existing broadcaster.
+                    # Ramka jest już sparsowana - kolejka niesie dict, konsument
+                    # (TradingBot.on_tick) nie parsuje jej drugi raz
                     if market_data_queue is not None:
                         try:
-                            market_data_queue.put_nowait(json.dumps(enhanced_data))
+                            try:
+                                market_data_queue.put_nowait(enhanced_data)
+                            except asyncio.QueueFull:
+                                # Kolejka ograniczona: najstarszy tick jest nieaktualny
+                                market_data_queue.get_nowait()
+                                market_data_queue.put_nowait(enhanced_data)
                         except Exception as e:
                             logger.warning("Failed to enqueue enhanced market data: %s", e, exc_info=True)
             except Exception as e:
@@ -914,21 +946,27 @@ async def user_data_stream_listener():
             async with websockets.connect(ws_url, ping_interval=20, ping_timeout=10) as ws:
                 logger.info("USER_WS: connected")
                 reconnect_delay = 5  # reset backoff
-                async for raw_msg in ws:
-                    try:
-                        data = json.loads(raw_msg)
-                    except Exception:
-                        logger.warning("USER_WS: failed to parse message JSON")
-                        continue
-                    event_type = data.get('e')
-                    if event_type:
-                        logger.debug(f"USER_WS: event {event_type}, keys={list(data.keys())}")
-                    else:
-                        logger.debug(f"USER_WS: unknown event: {data}")
-                    try:
-                        _user_stream_event_queue.put_nowait(data)
-                    except asyncio.QueueFull:
-                        logger.warning("USER_WS: event queue full – dropping event")
+                try:
+                    while True:
+                        # Ramki jako bytes: orjson parsuje je bez dekodowania do str
+                        raw_msg = await ws.recv(decode=False)
+                        try:
+                            data = _json_loads(raw_msg)
+                        except Exception:
+                            logger.warning("USER_WS: failed to parse message JSON")
+                            continue
+                        event_type = data.get('e')
+                        if event_type:
+                            logger.debug("USER_WS: event %s, keys=%s", event_type, list(data))
+                        else:
+                            logger.debug("USER_WS: unknown event: %s", data)
+                        try:
+                            _user_stream_event_queue.put_nowait(data)
+                        except asyncio.QueueFull:
+                            logger.warning("USER_WS: event queue full – dropping event")
+                except websockets.ConnectionClosedOK:
+                    # Zamknięcie bez błędu - jak koniec "async for", połącz ponownie
+                    pass
         except asyncio.CancelledError:
             logger.info("USER_WS: listener cancelled")
             break
@@ -981,9 +1019,12 @@ async def user_data_event_processor():
                     'eventTime': evt.get('E'),
                     'orderTime': evt.get('T')
                 }
-                logger.debug(f"USER_STREAM NORM execution_report: {norm}")
+                logger.debug("USER_STREAM NORM execution_report: %s", norm)
                 await order_store.apply_execution_report({'orderId': norm['orderId'], **norm})
             elif etype == 'outboundAccountPosition':
+                # Salda się zmieniły - nie serwuj starego snapshotu z cache klienta
+                if binance_client:
+                    binance_client.invalidate_account_cache()
                 balances = evt.get('B', [])
                 norm = {
                     'type': 'account_position',
@@ -996,9 +1037,11 @@ async def user_data_event_processor():
                         } for b in balances
                     ]
                 }
-                logger.debug(f"USER_STREAM NORM account_position: assets={len(norm['balances'])}")
+                logger.debug("USER_STREAM NORM account_position: assets=%d", len(norm['balances']))
                 await order_store.apply_account_position({'balances': norm['balances']})
             elif etype == 'balanceUpdate':
+                if binance_client:
+                    binance_client.invalidate_account_cache()
                 norm = {
                     'type': 'balance_update',
                     'asset': evt.get('a'),
@@ -1006,7 +1049,7 @@ async def user_data_event_processor():
                     'clearTime': evt.get('T'),
                     'eventTime': evt.get('E')
                 }
-                logger.debug(f"USER_STREAM NORM balance_update: {norm}")
+                logger.debug("USER_STREAM NORM balance_update: %s", norm)
                 await order_store.apply_balance_update(norm)
             elif etype == 'listStatus':
                 norm = {
@@ -1019,10 +1062,10 @@ async def user_data_event_processor():
                     'orders': evt.get('O'),
                     'eventTime': evt.get('E')
                 }
-                logger.debug(f"USER_STREAM NORM list_status: {norm}")
+                logger.debug("USER_STREAM NORM list_status: %s", norm)
                 await order_store.apply_list_status(norm)
             else:
-                logger.debug(f"USER_STREAM: unhandled event type {etype}")
+                logger.debug("USER_STREAM: unhandled event type %s", etype)
             # Phase 3 will consume normalizations; for now just log.
     except asyncio.CancelledError:
         logger.info("USER_STREAM: processor cancelled")
@@ -1133,7 +1176,7 @@ async def market_data_broadcaster():
                             "change": ticker_24hr.get('priceChange', '0'),
                             "changePercent": ticker_24hr.get('priceChangePercent', '0')
                         }
-                        logger.debug(f"Broadcasting ticker data for {symbol}: {ticker_data}")
+                        logger.debug("Broadcasting ticker data for %s: %s", symbol, ticker_data)
                         await manager.broadcast_to_market(ticker_data)
 
                     # Get order book data
@@ -1145,7 +1188,7 @@ async def market_data_broadcaster():
                             "bids": orderbook.get('bids', [])[:10],
                             "asks": orderbook.get('asks', [])[:10]
                         }
-                        logger.debug(f"Broadcasting orderbook data for {symbol}")
+                        logger.debug("Broadcasting orderbook data for %s", symbol)
                         await manager.broadcast_to_market(orderbook_data)
 
                     # Note: Kline data removed - frontend uses Binance WebSocket directly for faster updates
@@ -1332,7 +1375,7 @@ async def websocket_market_endpoint(websocket: WebSocket):
             try:
                 # Wait for messages from client
                 data = await websocket.receive_json()
-                logger.debug(f"Market WebSocket received: {data}")
+                logger.debug("Market WebSocket received: %s", data)
 
                 # Handle different message types
                 message_type = data.get('type')
@@ -1958,7 +2001,7 @@ async def get_orders_history(
                 return {"error": "symbol required for binance source"}
             if not binance_client:
                 return {"error": "Binance client not available"}
-            orders = await binance_client.get_all_orders_async(
+            orders = await binance_client.get_all_orders_raw_async(
                 symbol=symbol,
                 limit=min(limit, 1000),
                 order_id=orderId,
@@ -1967,7 +2010,11 @@ async def get_orders_history(
             )
             if orders is None:
                 return {"error": "Failed to fetch orders history", "source": "binance"}
-            return {"items": orders, "nextCursor": None, "hasMore": False, "source": "binance"}
+            # Lista z Binance trafia do odpowiedzi bez parsowania i ponownej serializacji
+            return Response(
+                b'{"items":' + orders + b',"nextCursor":null,"hasMore":false,"source":"binance"}',
+                media_type="application/json"
+            )
         # Local source
         if limit <= 0:
             limit = 1
@@ -11,14 +11,23 @@ This module implements optimized market data streaming with:
 import asyncio
 import json
 import logging
-import threading
+import ssl
 import time
-import websocket
+import websockets
 from typing import Dict, Set, Optional, List, Callable
 from collections import defaultdict
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# One TLS context for the stream connection so reconnects reuse the loaded CAs
+_WS_SSL_CONTEXT = ssl.create_default_context()
+
 
 class MarketDataManager:
     """
@@ -28,21 +37,34 @@ class MarketDataManager:
     - Subscribe only to symbols with active clients
     - Automatic unsubscribe when no clients remain
     - Client tracking and reference counting
-    - WebSocket connection pooling and reuse
+    - One multiplexed /stream connection shared by all symbols
     """
 
-    def __init__(self, ws_url: str, env: str = "testnet", main_loop: Optional[asyncio.AbstractEventLoop] = None):
+    def __init__(
+        self,
+        ws_url: str,
+        env: str = "testnet",
+        main_loop: Optional[asyncio.AbstractEventLoop] = None,
+        compression: Optional[str] = None,
+    ):
         self.ws_url = ws_url.rstrip('/')
         self.env = env
         self.main_loop = main_loop
+        # "deflate" negotiates permessage-deflate on the stream connection
+        self.compression = compression
 
         # Symbol subscription tracking
         self.symbol_subscribers: Dict[str, Set[str]] = defaultdict(set)  # symbol -> set of client_ids
         self.client_symbols: Dict[str, Set[str]] = defaultdict(set)      # client_id -> set of symbols
 
         # WebSocket connections tracking
-        self.active_streams: Dict[str, Dict] = {}  # symbol -> {ws_app, thread, connected}
+        self.active_streams: Dict[str, Dict] = {}  # symbol -> {stream, connected}
         self.message_handlers: List[Callable] = []
+        # Wszystkie symbole idą jednym połączeniem /stream (SUBSCRIBE/UNSUBSCRIBE)
+        self._connection_task: Optional[asyncio.Task] = None
+        self._ws = None
+        self._control_id = 0
+        self._control_tasks: Set[asyncio.Task] = set()
 
         # Configuration
         self.reconnect_delay = 5
@@ -166,105 +188,141 @@ class MarketDataManager:
         return list(self.symbol_subscribers.keys())
 
     def _start_symbol_stream(self, symbol: str):
-        """Start WebSocket stream for a symbol"""
+        """Add a symbol's stream to the shared connection"""
         if symbol in self.active_streams:
             logger.warning(f"Stream for {symbol} already active")
             return
 
         stream_name = f"{symbol.lower()}@ticker"
-
-        if self.env == "testnet":
-            url = f"{self.ws_url}/ws/{stream_name}"
-        else:
-            # For production, we'll use single connection per symbol for now
-            # Could be optimized to use multi-stream connection
-            url = f"{self.ws_url}/ws/{stream_name}"
-
-        logger.info(f"Starting stream for {symbol}: {url}")
-
-        ws_app = websocket.WebSocketApp(
-            url,
-            on_message=lambda ws, msg: self._on_message(symbol, ws, msg),
-            on_error=lambda ws, error: self._on_error(symbol, ws, error),
-            on_close=lambda ws, close_status_code, close_msg: self._on_close(symbol, ws, close_status_code, close_msg),
-            on_open=lambda ws: self._on_open(symbol, ws)
-        )
-
-        thread = threading.Thread(target=ws_app.run_forever, daemon=True)
-        thread.start()
+        logger.info(f"Starting stream for {symbol}: {stream_name}")
 
         self.active_streams[symbol] = {
-            "ws_app": ws_app,
-            "thread": thread,
-            "connected": False,
-            "url": url,
+            "stream": stream_name,
+            "connected": self._ws is not None,
             "start_time": time.time()
         }
 
+        if self._connection_task is None or self._connection_task.done():
+            loop = self.main_loop or asyncio.get_event_loop()
+            self._connection_task = loop.create_task(self._run_connection())
+        else:
+            self._send_control("SUBSCRIBE", [stream_name])
+
     def _stop_symbol_stream(self, symbol: str):
-        """Stop WebSocket stream for a symbol"""
+        """Remove a symbol's stream from the shared connection"""
         if symbol not in self.active_streams:
             logger.warning(f"No active stream for {symbol}")
             return
 
         logger.info(f"Stopping stream for {symbol}")
 
-        stream_info = self.active_streams[symbol]
-        stream_info["ws_app"].close()
-
-        # Clean up
-        del self.active_streams[symbol]
+        stream_info = self.active_streams.pop(symbol)
+        if self.active_streams:
+            self._send_control("UNSUBSCRIBE", [stream_info["stream"]])
+        elif self._connection_task is not None:
+            # Ostatni symbol - zamykamy całe połączenie
+            self._connection_task.cancel()
+            self._connection_task = None
+
+    async def _run_connection(self):
+        """Read the multiplexed /stream connection, reconnecting while any symbol is subscribed"""
+        while self.active_streams:
+            streams = [info["stream"] for info in self.active_streams.values()]
+            url = f"{self.ws_url}/stream?streams={'/'.join(streams)}"
+            try:
+                async with websockets.connect(
+                    url,
+                    ssl=_WS_SSL_CONTEXT if url.startswith("wss://") else None,
+                    compression=self.compression,
+                    ping_interval=20,
+                    ping_timeout=10,
+                ) as ws:
+                    self._on_open(ws, streams)
+                    try:
+                        while True:
+                            # Surowe bajty - parser JSON sam waliduje UTF-8
+                            self._on_message(await ws.recv(decode=False))
+                    except websockets.ConnectionClosedOK:
+                        pass
+                    finally:
+                        self._ws = None
+                self._on_close(ws.close_code)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._on_error(e)
+                self._on_close(None)
+
+            # Reconnect if any symbol still has subscribers and should reconnect
+            if not (self.should_reconnect and self.active_streams):
+                break
+            logger.info(f"Reconnecting market data stream in {self.reconnect_delay} seconds")
+            self.stats["reconnections"] += 1
+            await asyncio.sleep(self.reconnect_delay)
 
-    def _on_message(self, symbol: str, ws, message: str):
-        """Handle WebSocket message for a specific symbol"""
+    def _send_control(self, method: str, streams: List[str]):
+        """Send SUBSCRIBE/UNSUBSCRIBE on the open connection (a reconnect picks up active_streams anyway)"""
+        if self._ws is None:
+            return
+        self._control_id += 1
+        frame = json.dumps({"method": method, "params": streams, "id": self._control_id})
+        task = asyncio.ensure_future(self._ws.send(frame))
+        self._control_tasks.add(task)
+        task.add_done_callback(self._control_tasks.discard)
+
+    def _on_message(self, message: bytes):
+        """Handle a combined-stream frame (runs on the event loop)"""
         try:
-            data = json.loads(message)
-
-            # Add symbol context to message
-            enhanced_message = {
-                "symbol": symbol,
-                "data": data,
-                "timestamp": time.time()
-            }
-
-            # Forward to all registered handlers
-            for handler in self.message_handlers:
-                try:
-                    if self.main_loop:
-                        self.main_loop.call_soon_threadsafe(
-                            lambda: asyncio.create_task(handler(enhanced_message))
-                        )
-                    else:
-                        handler(enhanced_message)
-                except Exception as e:
-                    logger.error(f"Error in message handler: {e}")
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse WebSocket message for {symbol}: {e}")
-
-    def _on_error(self, symbol: str, ws, error):
-        """Handle WebSocket error for a specific symbol"""
-        logger.error(f"WebSocket error for {symbol}: {error}")
-
-    def _on_close(self, symbol: str, ws, close_status_code, close_msg):
-        """Handle WebSocket close for a specific symbol"""
-        logger.info(f"WebSocket closed for {symbol} (code: {close_status_code})")
-
-        if symbol in self.active_streams:
-            self.active_streams[symbol]["connected"] = False
+            frame = _json_loads(message)
+        except ValueError as e:
+            logger.error(f"Failed to parse WebSocket message: {e}")
+            return
 
-        # Reconnect if symbol still has subscribers and should reconnect
-        if self.should_reconnect and symbol in self.symbol_subscribers and len(self.symbol_subscribers[symbol]) > 0:
-            logger.info(f"Reconnecting to {symbol} in {self.reconnect_delay} seconds")
-            threading.Timer(self.reconnect_delay, lambda: self._start_symbol_stream(symbol)).start()
-            self.stats["reconnections"] += 1
+        # Odpowiedzi na SUBSCRIBE/UNSUBSCRIBE ({"result": null, "id": n}) pomijamy
+        if not isinstance(frame, dict) or "stream" not in frame:
+            return
 
-    def _on_open(self, symbol: str, ws):
-        """Handle WebSocket open for a specific symbol"""
-        logger.info(f"WebSocket connected for {symbol}")
+        # Add symbol context to message
+        enhanced_message = {
+            "symbol": frame["stream"].partition("@")[0].upper(),
+            "data": frame.get("data"),
+            "timestamp": time.time()
+        }
 
-        if symbol in self.active_streams:
-            self.active_streams[symbol]["connected"] = True
+        for handler in self.message_handlers:
+            try:
+                result = handler(enhanced_message)
+                if asyncio.iscoroutine(result):
+                    asyncio.create_task(result)
+            except Exception as e:
+                logger.error(f"Error in message handler: {e}")
+
+    def _on_error(self, error):
+        """Handle WebSocket error on the stream connection"""
+        logger.error(f"Market data WebSocket error: {error}")
+
+    def _on_close(self, close_status_code):
+        """Handle WebSocket close on the stream connection"""
+        logger.info(f"Market data WebSocket closed (code: {close_status_code})")
+
+        for stream_info in self.active_streams.values():
+            stream_info["connected"] = False
+
+    def _on_open(self, ws, streams: List[str]):
+        """Handle WebSocket open; sync streams changed while connecting"""
+        logger.info(f"Market data WebSocket connected ({len(streams)} streams)")
+
+        self._ws = ws
+        for stream_info in self.active_streams.values():
+            stream_info["connected"] = True
+
+        current = [info["stream"] for info in self.active_streams.values()]
+        added = [s for s in current if s not in streams]
+        removed = [s for s in streams if s not in current]
+        if added:
+            self._send_control("SUBSCRIBE", added)
+        if removed:
+            self._send_control("UNSUBSCRIBE", removed)
 
     def get_stats(self) -> Dict:
         """Get comprehensive statistics about the manager"""
@@ -287,8 +345,9 @@ class MarketDataManager:
         logger.info("Shutting down MarketDataManager")
         self.should_reconnect = False
 
-        for symbol in list(self.active_streams.keys()):
-            self._stop_symbol_stream(symbol)
+        if self._connection_task is not None:
+            self._connection_task.cancel()
+            self._connection_task = None
 
         # Clear all subscriptions
         self.symbol_subscribers.clear()
@@ -1,8 +1,11 @@
+import json
+
 from backend.binance_client import BinanceRESTClient
 
 class DummyResponse:
     def __init__(self, json_data):
         self._json = json_data
+        self.content = json.dumps(json_data).encode()
     def json(self):
         return self._json
     def raise_for_status(self):
@@ -22,7 +25,280 @@ def test_get_ticker(monkeypatch):
     client = BinanceRESTClient()
     def mock_get(*args, **kwargs):
         return DummyResponse({"symbol": "BTCUSDT", "price": "60000.00"})
-    monkeypatch.setattr("requests.get", mock_get)
+    monkeypatch.setattr(client._session, "get", mock_get)
     result = client.get_ticker("BTCUSDT")
     assert result["symbol"] == "BTCUSDT"
     assert float(result["price"]) > 0
+
+def test_get_ticker_serves_repeat_calls_from_ttl_cache(monkeypatch):
+    from backend import binance_client
+    client = BinanceRESTClient()
+    calls = []
+    def mock_get(url, **kwargs):
+        calls.append(url)
+        return DummyResponse({"symbol": "BTCUSDT", "price": str(len(calls))})
+    monkeypatch.setattr(client._session, "get", mock_get)
+    assert client.get_ticker("btcusdt") == client.get_ticker("BTCUSDT")
+    assert len(calls) == 1
+    # Other symbols are cached under their own key
+    client.get_ticker("ETHUSDT")
+    assert len(calls) == 2
+    monkeypatch.setattr(binance_client, "_TICKER_TTL", 0)
+    client._response_cache.clear()
+    client.get_ticker("BTCUSDT")
+    client.get_ticker("BTCUSDT")
+    assert len(calls) == 4
+
+def test_get_ticker_24hr_served_from_fresh_all_symbols_snapshot(monkeypatch):
+    client = BinanceRESTClient()
+    calls = []
+    def mock_get(url, **kwargs):
+        calls.append(url)
+        if "symbol=" in url:
+            return DummyResponse({"symbol": "XRPUSDT", "lastPrice": "0.5"})
+        return DummyResponse([{"symbol": "BTCUSDT", "lastPrice": "1"}])
+    monkeypatch.setattr(client._session, "get", mock_get)
+    client.get_ticker_24hr_all()
+    assert client.get_ticker_24hr("btcusdt") == {"symbol": "BTCUSDT", "lastPrice": "1"}
+    assert len(calls) == 1
+    # Symbols missing from the snapshot still go to the per-symbol endpoint
+    assert client.get_ticker_24hr("XRPUSDT")["lastPrice"] == "0.5"
+    assert len(calls) == 2
+
+def test_exchange_info_is_pruned_and_indexed(monkeypatch):
+    client = BinanceRESTClient()
+    calls = []
+    def mock_get(url, **kwargs):
+        calls.append(url)
+        return DummyResponse({"timezone": "UTC", "rateLimits": [], "symbols": [
+            {"symbol": "BTCUSDT", "status": "TRADING", "baseAsset": "BTC", "quoteAsset": "USDT",
+             "orderTypes": ["LIMIT"], "filters": [{"filterType": "LOT_SIZE"}]},
+        ]})
+    monkeypatch.setattr(client._session, "get", mock_get)
+    info = client.get_exchange_info()
+    assert info == {"symbols": [{"symbol": "BTCUSDT", "status": "TRADING", "baseAsset": "BTC",
+                                 "quoteAsset": "USDT", "filters": [{"filterType": "LOT_SIZE"}]}]}
+    assert client.get_symbol_info("btcusdt") is info["symbols"][0]
+    assert client.get_symbol_info("ETHUSDT") is None
+    assert len(calls) == 1
+
+def test_signed_query_matches_hmac():
+    import hashlib
+    import hmac
+    client = BinanceRESTClient()
+    client.api_secret = "secret"
+    client._hmac_template = hmac.new(b"secret", None, hashlib.sha256)
+    query = client._signed_query({"symbol": "BTCUSDT", "timestamp": 1})
+    signed = b"symbol=BTCUSDT&timestamp=1&recvWindow=5000"
+    expected = hmac.new(b"secret", signed, hashlib.sha256).hexdigest()
+    assert query == f"symbol=BTCUSDT&timestamp=1&recvWindow=5000&signature={expected}"
+    # Template must stay reusable across calls
+    assert client._signed_query({"symbol": "BTCUSDT", "timestamp": 1}) == query
+
+def test_async_ws_client_forwards_frames(monkeypatch):
+    import asyncio
+    from backend import binance_client
+
+    class FakeConnection:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def __init__(self):
+            self.frames = [b'{"e":"24hrTicker"}', b'{"e":"depthUpdate"}']
+
+        async def recv(self, decode=None):
+            assert decode is False
+            if not self.frames:
+                raise binance_client.websockets.ConnectionClosedOK(None, None)
+            return self.frames.pop(0)
+
+    queue = asyncio.Queue()
+    client = binance_client.BinanceWebSocketClient(["btcusdt@ticker", "btcusdt@depth"], queues=[queue])
+    urls = []
+
+    def fake_connect(url, **kwargs):
+        urls.append(url)
+        client.should_reconnect = False
+        return FakeConnection()
+
+    monkeypatch.setattr(binance_client.websockets, "connect", fake_connect)
+
+    async def scenario():
+        await client.connect()
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    received = asyncio.run(scenario())
+    assert urls[0].endswith("/stream?streams=btcusdt@ticker/btcusdt@depth")
+    assert received == [{"e": "24hrTicker"}, {"e": "depthUpdate"}]
+
+def test_ws_client_decodes_frames_once_for_all_queues():
+    import asyncio
+    from backend.binance_client import BinanceWebSocketClient
+
+    queues = [asyncio.Queue(), asyncio.Queue()]
+    client = BinanceWebSocketClient(["btcusdt@ticker"], queues=queues)
+    client._forward('{"stream":"btcusdt@ticker","data":{"c":"1"}}')
+    client._forward("not json")
+    first, second = [[q.get_nowait() for _ in range(q.qsize())] for q in queues]
+    assert first == [{"stream": "btcusdt@ticker", "data": {"c": "1"}}]
+    assert second[0] is first[0]
+
+def test_order_body_matches_urlencoded_params(monkeypatch):
+    from urllib.parse import urlencode
+    from backend import binance_client
+    client = BinanceRESTClient()
+    monkeypatch.setattr(binance_client.time, "time_ns", lambda: 1_700_000_000_000_000_000)
+    body = client._order_body("btcusdt", "buy", "limit", 0.5, "1e+3", "gtc")
+    expected = urlencode({
+        "symbol": "BTCUSDT", "side": "BUY", "type": "LIMIT", "quantity": "0.5",
+        "price": "1e+3", "timeInForce": "GTC", "timestamp": 1_700_000_000_000,
+    })
+    assert body == client._sign_query(expected)
+
+def test_ws_client_routes_frames_by_stream_name_without_parsing(monkeypatch):
+    import asyncio
+    from backend import binance_client
+
+    def fail_parse(_):
+        raise AssertionError("payload must not be parsed")
+
+    monkeypatch.setattr(binance_client, "_json_loads", fail_parse)
+    btc = asyncio.Queue()
+    client = binance_client.BinanceWebSocketClient(
+        ["btcusdt@ticker", "ethusdt@ticker"], raw=True, stream_queues={"btcusdt@ticker": btc}
+    )
+    client._forward(b'{"stream":"btcusdt@ticker","data":{"c":"1"}}')
+    client._forward(b'{"stream":"ethusdt@ticker","data":{"c":"2"}}')
+    assert [btc.get_nowait() for _ in range(btc.qsize())] == [b'{"stream":"btcusdt@ticker","data":{"c":"1"}}']
+
+def test_ws_client_drops_oldest_frame_when_queue_is_full():
+    import asyncio
+    from backend.binance_client import BinanceWebSocketClient
+
+    queue = asyncio.Queue(maxsize=2)
+    client = BinanceWebSocketClient(["btcusdt@ticker"], queues=[queue])
+    for i in range(4):
+        client._forward(f'{{"n":{i}}}')
+    assert [queue.get_nowait() for _ in range(queue.qsize())] == [{"n": 2}, {"n": 3}]
+    assert client._dropped == 2
+
+def test_ws_client_subscribe_sends_control_frame_on_live_connection():
+    import asyncio
+    import json
+    from backend.binance_client import BinanceWebSocketClient, _decode_frame
+
+    sent = []
+
+    class FakeWS:
+        async def send(self, frame):
+            sent.append(frame)
+
+    client = BinanceWebSocketClient(["btcusdt@ticker"])
+    client._ws = FakeWS()
+
+    async def scenario():
+        await client.subscribe(["ethusdt@ticker", "btcusdt@ticker"])
+        await client.unsubscribe(["btcusdt@ticker"])
+
+    asyncio.run(scenario())
+    assert [json.loads(f) for f in sent] == [
+        {"method": "SUBSCRIBE", "params": ["ethusdt@ticker"], "id": 1},
+        {"method": "UNSUBSCRIBE", "params": ["btcusdt@ticker"], "id": 2},
+    ]
+    # Reconnects pick up the current stream set
+    assert client._combined_url.endswith("/stream?streams=ethusdt@ticker")
+    # Control replies are not forwarded as market data
+    assert _decode_frame('{"result":null,"id":1}') is None
+
+def test_get_balance_reuses_cached_account_info(monkeypatch):
+    client = BinanceRESTClient()
+    calls = []
+
+    def mock_get(url, **kwargs):
+        calls.append(url)
+        return DummyResponse({"balances": [
+            {"asset": "BTC", "free": "0.5", "locked": "0"},
+            {"asset": "USDT", "free": "100", "locked": "1"},
+        ]})
+
+    monkeypatch.setattr(client._session, "get", mock_get)
+    assert client.get_balance("btc")["free"] == "0.5"
+    assert client.get_balance("USDT")["locked"] == "1"
+    assert client.get_balance("ETH") == {"asset": "ETH", "free": "0", "locked": "0"}
+    assert len(calls) == 1
+    assert "omitZeroBalances=true" in calls[0]
+
+    client.invalidate_account_cache()
+    client.get_balance("BTC")
+    assert len(calls) == 2
+
+
+def test_get_account_info_warms_balance_index(monkeypatch):
+    client = BinanceRESTClient()
+    calls = []
+
+    def mock_get(url, **kwargs):
+        calls.append(url)
+        return DummyResponse({"balances": [{"asset": "BTC", "free": "1", "locked": "0"}]})
+
+    monkeypatch.setattr(client._session, "get", mock_get)
+    client.get_account_info()
+    assert client.get_balance("BTC")["free"] == "1"
+    assert len(calls) == 1
+    assert "omitZeroBalances" not in calls[0]
+
+def test_signature_is_consistent_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    client = BinanceRESTClient()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        signatures = set(pool.map(lambda _: client._signature("symbol=BTCUSDT&timestamp=1"), range(16)))
+    assert signatures == {client._signature("symbol=BTCUSDT&timestamp=1")}
+
+def test_ws_client_reconnects_with_backoff(monkeypatch):
+    import asyncio
+    from backend import binance_client
+
+    attempts = []
+    delays = []
+
+    def failing_connect(url, **kwargs):
+        attempts.append(url)
+        if len(attempts) == 3:
+            client.should_reconnect = False
+        raise OSError("connection refused")
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(binance_client.websockets, "connect", failing_connect)
+    monkeypatch.setattr(binance_client.asyncio, "sleep", fake_sleep)
+    client = binance_client.BinanceWebSocketClient(["btcusdt@ticker"])
+
+    async def scenario():
+        await client.connect()
+
+    asyncio.run(scenario())
+    assert len(attempts) == 3
+    assert len(delays) == 2
+    assert 1.0 <= delays[0] < 1.5 and 2.0 <= delays[1] < 2.5
+    assert client._reconnect_attempts == 2
+
+def test_fetch_many_returns_results_in_order(monkeypatch):
+    from backend.binance_client import BinanceClient
+    client = BinanceClient()
+
+    def mock_get(url, **kwargs):
+        if "/v3/ticker/price" in url:
+            return DummyResponse({"symbol": "BTCUSDT", "price": "1"})
+        return DummyResponse({"bids": [], "asks": []})
+
+    monkeypatch.setattr(client._session, "get", mock_get)
+    ticker, orderbook = client.fetch_many([
+        ("get_ticker", {"symbol": "btcusdt"}),
+        ("get_orderbook", {"symbol": "BTCUSDT", "limit": 5}),
+    ])
+    assert ticker["symbol"] == "BTCUSDT"
+    assert orderbook == {"bids": [], "asks": []}
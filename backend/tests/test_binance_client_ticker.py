@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 from backend.binance_client import BinanceClient
 
 @pytest.fixture
@@ -17,8 +17,8 @@ async def test_get_ticker_24hr_success(binance_client):
         "priceChangePercent": "2.27"
     }
 
-    with patch('asyncio.to_thread') as mock_to_thread:
-        mock_to_thread.return_value = mock_response
+    with patch.object(BinanceClient, '_request_async', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response
 
         result = await binance_client.get_ticker_24hr("BTCUSDT")
 
@@ -31,8 +31,8 @@ async def test_get_ticker_24hr_success(binance_client):
 @pytest.mark.asyncio
 async def test_get_ticker_24hr_failure(binance_client):
     """Test ticker 24hr data retrieval failure"""
-    with patch('asyncio.to_thread') as mock_to_thread:
-        mock_to_thread.side_effect = Exception("API Error")
+    with patch.object(BinanceClient, '_request_async', new_callable=AsyncMock) as mock_request:
+        mock_request.side_effect = Exception("API Error")
 
         result = await binance_client.get_ticker_24hr("BTCUSDT")
 
@@ -46,8 +46,8 @@ async def test_get_order_book_success(binance_client):
         "asks": [["45001.00", "1.5"], ["45002.00", "0.5"]]
     }
 
-    with patch('asyncio.to_thread') as mock_to_thread:
-        mock_to_thread.return_value = mock_response
+    with patch.object(BinanceClient, '_request_async', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response
 
         result = await binance_client.get_order_book("BTCUSDT", limit=20)
 
@@ -60,9 +60,134 @@ async def test_get_order_book_success(binance_client):
 @pytest.mark.asyncio
 async def test_get_order_book_failure(binance_client):
     """Test order book retrieval failure"""
-    with patch('asyncio.to_thread') as mock_to_thread:
-        mock_to_thread.side_effect = Exception("API Error")
+    with patch.object(BinanceClient, '_request_async', new_callable=AsyncMock) as mock_request:
+        mock_request.side_effect = Exception("API Error")
 
         result = await binance_client.get_order_book("BTCUSDT")
 
         assert result is None
+
+@pytest.mark.asyncio
+async def test_get_exchange_info_async_uses_native_http_and_cache(binance_client):
+    """Exchange info is fetched on the event loop and served from cache afterwards"""
+    import httpx
+
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request.url.path)
+        return httpx.Response(200, json={"symbols": [{"symbol": "BTCUSDT"}]})
+
+    await binance_client._http.aclose()
+    binance_client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    first = await binance_client.get_exchange_info_async()
+    second = await binance_client.get_exchange_info_async()
+
+    assert first == second == {"symbols": [{"symbol": "BTCUSDT"}]}
+    assert requests_seen == ["/api/v3/exchangeInfo"]
+    await binance_client.close()
+
+@pytest.mark.asyncio
+async def test_cancel_order_async_sends_signed_delete_and_invalidates_cache(binance_client):
+    """cancel_order_async should hit the API natively and drop cached account state"""
+    import time
+    import httpx
+
+    seen = []
+
+    def handler(request):
+        seen.append((request.method, request.url.path, request.content))
+        assert request.headers["content-type"] == "application/x-www-form-urlencoded"
+        return httpx.Response(200, json={"status": "CANCELED"})
+
+    await binance_client._http.aclose()
+    binance_client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    binance_client._account_info_cache = {"balances": []}
+    binance_client._account_info_cache_time = time.monotonic()
+
+    result = await binance_client.cancel_order_async("btcusdt", order_id=42)
+
+    assert result == {"status": "CANCELED"}
+    method, path, body = seen[0]
+    assert (method, path) == ("DELETE", "/api/v3/order")
+    assert b"symbol=BTCUSDT" in body and b"signature=" in body
+    assert binance_client._cached_account_info() is None
+    await binance_client.close()
+
+@pytest.mark.asyncio
+async def test_concurrent_get_ticker_calls_share_one_request(binance_client):
+    """Concurrent identical calls are collapsed into a single HTTP request"""
+    import asyncio
+
+    async def slow_request(method, url, body=None):
+        await asyncio.sleep(0.01)
+        return {"symbol": "BTCUSDT", "price": "1"}
+
+    with patch.object(BinanceClient, '_request_async', side_effect=slow_request) as mock_request:
+        results = await asyncio.gather(*(binance_client.get_ticker("BTCUSDT") for _ in range(5)))
+
+    assert mock_request.call_count == 1
+    assert all(r == {"symbol": "BTCUSDT", "price": "1"} for r in results)
+    assert binance_client._inflight == {}
+    await binance_client.close()
+
+@pytest.mark.asyncio
+async def test_get_tickers_fans_out_or_uses_all_symbols_call(binance_client):
+    """Small batches go out concurrently; large ones use one all-symbols request"""
+    from backend import binance_client as module
+
+    async def fake_request(method, url, body=None):
+        if "symbol=" in url:
+            return {"symbol": url.rsplit("=", 1)[1], "price": "1"}
+        return [{"symbol": "BTCUSDT", "price": "2"}, {"symbol": "ETHUSDT", "price": "3"}]
+
+    with patch.object(BinanceClient, '_request_async', side_effect=fake_request) as mock_request:
+        small = await binance_client.get_tickers(["btcusdt", "ETHUSDT"])
+        assert [t["symbol"] for t in small] == ["BTCUSDT", "ETHUSDT"]
+        assert mock_request.call_count == 2
+
+        with patch.object(module, '_BATCH_ALL_THRESHOLD', 1):
+            large = await binance_client.get_tickers(["ETHUSDT", "XRPUSDT"])
+        assert large == [{"symbol": "ETHUSDT", "price": "3"}, None]
+        assert mock_request.call_count == 3
+    await binance_client.close()
+
+@pytest.mark.asyncio
+async def test_get_all_orders_raw_async_returns_undecoded_body(binance_client):
+    """The raw variant hands back the response bytes for pass-through"""
+    import httpx
+
+    body = b'[{"orderId":1,"status":"FILLED"}]'
+
+    def handler(request):
+        assert request.url.path == "/api/v3/allOrders"
+        assert request.url.params["symbol"] == "BTCUSDT"
+        return httpx.Response(200, content=body)
+
+    await binance_client._http.aclose()
+    binance_client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    assert await binance_client.get_all_orders_raw_async("btcusdt", limit=10) == body
+    await binance_client.close()
+
+@pytest.mark.asyncio
+async def test_place_orders_async_sends_each_order_and_keeps_order(binance_client):
+    """A burst of orders is sent concurrently and answered in input order"""
+    import httpx
+    from urllib.parse import parse_qs
+
+    def handler(request):
+        form = parse_qs(request.content.decode())
+        return httpx.Response(200, json={"symbol": form["symbol"][0], "side": form["side"][0]})
+
+    await binance_client._http.aclose()
+    binance_client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    results = await binance_client.place_orders_async([
+        {"symbol": "btcusdt", "side": "buy", "order_type": "market", "quantity": 1},
+        {"symbol": "ETHUSDT", "side": "SELL", "order_type": "LIMIT", "quantity": 2, "price": 3000},
+    ])
+
+    assert results == [{"symbol": "BTCUSDT", "side": "BUY"}, {"symbol": "ETHUSDT", "side": "SELL"}]
+    await binance_client.close()
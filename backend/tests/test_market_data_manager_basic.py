@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+from backend.market_data_manager import MarketDataManager
+
+
+def test_messages_are_dispatched_to_every_handler_on_the_loop():
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        manager = MarketDataManager("wss://example.invalid/ws", main_loop=loop)
+        received = {"a": [], "b": []}
+
+        async def handler_a(message):
+            received["a"].append((message["symbol"], message["data"]["n"]))
+
+        def handler_b(message):
+            received["b"].append((message["symbol"], message["data"]["n"]))
+
+        manager.add_message_handler(handler_a)
+        manager.add_message_handler(handler_b)
+
+        for i in range(3):
+            manager._on_message(f'{{"stream":"btcusdt@ticker","data":{{"n":{i}}}}}'.encode())
+        manager._on_message(b'{"result":null,"id":1}')
+        manager._on_message(b"not json")
+        await asyncio.sleep(0)
+        return received
+
+    received = asyncio.run(scenario())
+    # Every handler sees every message (no late-binding of the handler)
+    expected = [("BTCUSDT", 0), ("BTCUSDT", 1), ("BTCUSDT", 2)]
+    assert received == {"a": expected, "b": expected}
+
+
+class FakeWS:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, frame):
+        self.sent.append(json.loads(frame))
+
+
+def test_symbols_share_one_connection_and_use_control_frames(monkeypatch):
+    async def scenario():
+        manager = MarketDataManager("ws://example.invalid", main_loop=asyncio.get_running_loop())
+        started = []
+
+        async def fake_run():
+            started.append(True)
+            await asyncio.sleep(3600)
+
+        monkeypatch.setattr(manager, "_run_connection", fake_run)
+        manager.subscribe_client_to_symbol("c1", "btcusdt")
+        task = manager._connection_task
+        await asyncio.sleep(0)
+        ws = FakeWS()
+        manager._on_open(ws, ["btcusdt@ticker"])
+
+        manager.subscribe_client_to_symbol("c2", "ETHUSDT")
+        manager.unsubscribe_client_from_symbol("c1", "BTCUSDT")
+        await asyncio.sleep(0)
+        assert [(f["method"], f["params"]) for f in ws.sent] == [
+            ("SUBSCRIBE", ["ethusdt@ticker"]),
+            ("UNSUBSCRIBE", ["btcusdt@ticker"]),
+        ]
+        assert manager._connection_task is task
+
+        manager.unsubscribe_client_from_symbol("c2", "ETHUSDT")
+        await asyncio.sleep(0)
+        return task, manager, started
+
+    task, manager, started = asyncio.run(scenario())
+    assert started == [True]
+    assert task.cancelled()
+    assert manager.active_streams == {}
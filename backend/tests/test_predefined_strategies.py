@@ -7,6 +7,7 @@ from unittest.mock import patch, MagicMock
 from backend.bot.predefined_strategies import (
     get_predefined_strategies,
     get_strategy_config,
+    get_strategy_config_readonly,
     get_strategy_metadata,
     list_strategy_keys,
     validate_strategy_config,
@@ -151,6 +152,40 @@ class TestPredefinedStrategies:
         # Other config should be unchanged
         assert config2["symbol"] == "BTCUSDT"
         assert config1 is not config2
+
+    def test_strategy_config_copy_is_deep(self):
+        """Nested parameters of a returned config are not shared with the source"""
+        config = get_strategy_config("conservative_scalping")
+        config["parameters"]["ma_period"] = 999
+        config["risk_management"]["max_daily_trades"] = 999
+
+        fresh = get_strategy_config("conservative_scalping")
+        assert fresh["parameters"]["ma_period"] != 999
+        assert fresh["risk_management"]["max_daily_trades"] != 999
+
+    def test_metadata_mutation_does_not_leak(self):
+        """Changing returned metadata (incl. tags) does not affect later calls"""
+        metadata = get_strategy_metadata("stable_dca")
+        metadata["name"] = "Changed"
+        metadata["tags"].append("changed")
+        get_predefined_strategies()["stable_dca"]["tags"].append("changed")
+
+        fresh = get_strategy_metadata("stable_dca")
+        assert fresh["name"] != "Changed"
+        assert "changed" not in fresh["tags"]
+        assert "changed" not in get_predefined_strategies()["stable_dca"]["tags"]
+        assert "changed" not in PREDEFINED_STRATEGIES["stable_dca"]["tags"]
+
+    def test_strategy_config_readonly_view(self):
+        """Read-only view reflects the config and rejects assignment"""
+        view = get_strategy_config_readonly("stable_dca")
+        assert view["type"] == get_strategy_config("stable_dca")["type"]
+        with pytest.raises(TypeError):
+            view["symbol"] = "ETHUSDT"
+        with pytest.raises(TypeError):
+            view["risk_management"]["max_daily_trades"] = 999
+        with pytest.raises(ValueError):
+            get_strategy_config_readonly("invalid_strategy")
     
     def test_predefined_strategies_have_required_structure(self):
         """Test that all predefined strategies have the required structure"""
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from backend.binance_client import BinanceClient
 
@@ -18,8 +18,8 @@ async def test_get_ticker_24hr_success(binance_client):
         "priceChangePercent": "2.27"
     }
 
-    with patch('asyncio.to_thread') as mock_to_thread:
-        mock_to_thread.return_value = mock_response
+    with patch.object(BinanceClient, '_request_async', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response
 
         result = await binance_client.get_ticker_24hr("BTCUSDT")
 
@@ -32,8 +32,8 @@ async def test_get_ticker_24hr_success(binance_client):
 @pytest.mark.asyncio
 async def test_get_ticker_24hr_failure(binance_client):
     """Test ticker 24hr data retrieval failure"""
-    with patch('asyncio.to_thread') as mock_to_thread:
-        mock_to_thread.side_effect = Exception("API Error")
+    with patch.object(BinanceClient, '_request_async', new_callable=AsyncMock) as mock_request:
+        mock_request.side_effect = Exception("API Error")
 
         result = await binance_client.get_ticker_24hr("BTCUSDT")
 
@@ -47,8 +47,8 @@ async def test_get_order_book_success(binance_client):
         "asks": [["45001.00", "1.5"], ["45002.00", "0.5"]]
     }
 
-    with patch('asyncio.to_thread') as mock_to_thread:
-        mock_to_thread.return_value = mock_response
+    with patch.object(BinanceClient, '_request_async', new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response
 
         result = await binance_client.get_order_book("BTCUSDT", limit=20)
 
@@ -61,8 +61,8 @@ async def test_get_order_book_success(binance_client):
 @pytest.mark.asyncio
 async def test_get_order_book_failure(binance_client):
     """Test order book retrieval failure"""
-    with patch('asyncio.to_thread') as mock_to_thread:
-        mock_to_thread.side_effect = Exception("API Error")
+    with patch.object(BinanceClient, '_request_async', new_callable=AsyncMock) as mock_request:
+        mock_request.side_effect = Exception("API Error")
 
         result = await binance_client.get_order_book("BTCUSDT")
 
@@ -4,5 +4,224 @@ def test_bot_start_stop():
     bot = TradingBot()
     bot.start()
     assert bot.get_status()["status"] == "running"
+    thread = bot.thread
     bot.stop()
     assert bot.get_status()["status"] == "stopped"
+    # stop() cancels the run task instead of waiting out the 2 s tick sleep
+    assert not thread.is_alive()
+
+
+def test_logs_are_bounded_to_last_20():
+    bot = TradingBot()
+    for i in range(50):
+        bot._add_log(f"log {i}")
+    logs = bot.get_logs()
+    assert isinstance(logs, list)
+    assert logs == [f"log {i}" for i in range(30, 50)]
+
+
+def test_bot_runs_as_task_on_the_running_loop():
+    import asyncio
+
+    async def scenario():
+        broadcasts = []
+
+        async def broadcast(payload):
+            broadcasts.append(payload["type"])
+
+        bot = TradingBot(broadcast_callback=broadcast, main_loop=asyncio.get_running_loop())
+        bot.start()
+        task = bot._task
+        await asyncio.sleep(0)
+        bot.stop()
+        await asyncio.sleep(0)
+        return bot, task, broadcasts
+
+    bot, task, broadcasts = asyncio.run(scenario())
+    assert bot.thread is None
+    assert task.cancelled()
+    assert "bot_status" in broadcasts and "log" in broadcasts
+
+
+def test_execute_strategy_dispatches_on_event_type():
+    import asyncio
+
+    bot = TradingBot()
+    asyncio.run(bot.execute_strategy({"e": "depthUpdate", "b": [["100.0", "1"]], "a": [["101.5", "1"]]}))
+    asyncio.run(bot.execute_strategy({"e": "trade"}))
+    logs = bot.get_logs()
+    assert logs[-2] == "OrderBook - Spread: $1.50, Bid: $100.00, Ask: $101.50"
+    assert logs[-1] == "Unknown event type: trade"
+
+
+def test_log_burst_is_broadcast_as_one_batch():
+    import asyncio
+
+    async def scenario():
+        sent = []
+
+        async def broadcast(payload):
+            sent.append(payload)
+
+        bot = TradingBot(broadcast_callback=broadcast, main_loop=asyncio.get_running_loop())
+        for i in range(5):
+            bot._add_log(f"tick {i}")
+        await asyncio.sleep(0)
+        bot._add_log("single")
+        await asyncio.sleep(0)
+        return sent
+
+    sent = asyncio.run(scenario())
+    assert len(sent) == 2
+    assert sent[0]["type"] == "log_batch"
+    assert [item["message"] for item in sent[0]["items"]] == [f"tick {i}" for i in range(5)]
+    assert sent[1]["type"] == "log" and sent[1]["message"] == "single"
+
+
+def test_logs_from_bot_thread_wake_the_main_loop_once():
+    import asyncio
+    import threading
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        sent = []
+
+        async def broadcast(payload):
+            sent.append(payload)
+
+        bot = TradingBot(broadcast_callback=broadcast, main_loop=loop)
+        wakeups = []
+        call_soon_threadsafe = loop.call_soon_threadsafe
+
+        def counting_call_soon_threadsafe(callback, *args):
+            wakeups.append(callback)
+            return call_soon_threadsafe(callback, *args)
+
+        loop.call_soon_threadsafe = counting_call_soon_threadsafe
+        try:
+            worker = threading.Thread(target=lambda: [bot._add_log(f"tick {i}") for i in range(5)])
+            worker.start()
+            worker.join()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+        finally:
+            del loop.call_soon_threadsafe
+        return sent, wakeups
+
+    sent, wakeups = asyncio.run(scenario())
+    assert len(wakeups) == 1
+    assert len(sent) == 1 and sent[0]["type"] == "log_batch"
+    assert [item["message"] for item in sent[0]["items"]] == [f"tick {i}" for i in range(5)]
+
+
+def test_status_changes_are_coalesced_into_one_frame():
+    import asyncio
+
+    async def scenario():
+        sent = []
+
+        async def broadcast(payload):
+            sent.append(payload)
+
+        bot = TradingBot(broadcast_callback=broadcast, main_loop=asyncio.get_running_loop())
+        bot._broadcast_status()
+        bot.status = "paused"
+        bot._broadcast_status()
+        await asyncio.sleep(0)
+        return sent
+
+    sent = asyncio.run(scenario())
+    assert len(sent) == 1
+    assert sent[0]["type"] == "bot_status"
+    assert sent[0]["status"]["status"] == "paused"
+
+
+def test_run_keeps_only_latest_tick_per_event_type():
+    import asyncio
+
+    async def scenario():
+        queue = asyncio.Queue(maxsize=128)
+        for i in range(3):
+            queue.put_nowait({"e": "24hrTicker", "n": i})
+        queue.put_nowait({"e": "kline", "n": 9})
+        bot = TradingBot(market_data_queue=queue)
+        first = await queue.get()
+        return bot._latest_market_data(first), queue
+
+    latest, queue = asyncio.run(scenario())
+    assert latest == [{"e": "24hrTicker", "n": 2}, {"e": "kline", "n": 9}]
+    assert queue.empty()
+
+
+def test_run_keeps_ticks_per_symbol_and_every_closed_kline():
+    import asyncio
+
+    async def scenario():
+        queue = asyncio.Queue(maxsize=128)
+        queue.put_nowait({"e": "24hrTicker", "s": "BTCUSDT", "n": 1})
+        queue.put_nowait({"e": "24hrTicker", "s": "ETHUSDT", "n": 2})
+        queue.put_nowait({"e": "kline", "s": "BTCUSDT", "k": {"x": True, "c": "100"}})
+        queue.put_nowait({"e": "kline", "s": "BTCUSDT", "k": {"x": False, "c": "101"}})
+        queue.put_nowait({"e": "24hrTicker", "s": "BTCUSDT", "n": 3})
+        bot = TradingBot(market_data_queue=queue)
+        first = await queue.get()
+        return bot._latest_market_data(first)
+
+    latest = asyncio.run(scenario())
+    assert latest == [
+        {"e": "24hrTicker", "s": "BTCUSDT", "n": 3},
+        {"e": "24hrTicker", "s": "ETHUSDT", "n": 2},
+        {"e": "kline", "s": "BTCUSDT", "k": {"x": True, "c": "100"}},
+        {"e": "kline", "s": "BTCUSDT", "k": {"x": False, "c": "101"}},
+    ]
+
+
+def test_simple_ma_keeps_running_sum_over_window():
+    import asyncio
+
+    bot = TradingBot()
+    bot.strategy_config["parameters"]["ma_period"] = 3
+    for price in [1.0, 2.0, 3.0, 4.0, 5.0]:
+        asyncio.run(bot._simple_ma_strategy(price, {}))
+    assert list(bot._ma_window) == [3.0, 4.0, 5.0]
+    assert bot._ma_sum == 12.0
+
+    # Krótszy okres - okno przycięte do ostatnich cen
+    bot.strategy_config["parameters"]["ma_period"] = 2
+    asyncio.run(bot._simple_ma_strategy(6.0, {}))
+    assert list(bot._ma_window) == [5.0, 6.0]
+    assert bot._ma_sum == 11.0
+
+
+def test_rsi_uses_wilder_smoothing_after_warmup():
+    import asyncio
+
+    bot = TradingBot()
+    bot.strategy_config["parameters"]["rsi_period"] = 2
+    for price in [10.0, 11.0, 10.0]:
+        asyncio.run(bot._rsi_strategy(price, {}))
+    rsi_data = bot.strategy_state["rsi_data"]
+    # Rozgrzewka: zwykła średnia z dwóch pierwszych zmian (+1, -1)
+    assert (rsi_data["avg_gain"], rsi_data["avg_loss"], rsi_data["count"]) == (0.5, 0.5, 2)
+
+    asyncio.run(bot._rsi_strategy(12.0, {}))
+    assert (rsi_data["avg_gain"], rsi_data["avg_loss"]) == (1.25, 0.25)
+
+
+def test_update_strategy_config_accepts_every_predefined_strategy():
+    import asyncio
+
+    from backend.bot.predefined_strategies import get_strategy_config, list_strategy_keys
+
+    bot = TradingBot()
+    for key in list_strategy_keys():
+        config = get_strategy_config(key)
+        assert bot.update_strategy_config(config), bot.get_logs()[-1]
+        assert bot.strategy_config["type"] == config["type"]
+
+    # Powrót do strategii MA - okno odbudowane przy pierwszym ticku
+    bot.update_strategy_config(get_strategy_config("conservative_scalping"))
+    ma_period = bot.strategy_config["parameters"]["ma_period"]
+    asyncio.run(bot._simple_ma_strategy(100.0, {}))
+    assert bot._ma_window.maxlen == ma_period
+    assert list(bot._ma_window) == [100.0] and bot._ma_sum == 100.0
@@ -25,3 +25,31 @@ def test_websocket_market():
         websocket.send_json({"type": "ping"})
         data = websocket.receive_json()
         assert data.get("type") == "pong"
+
+
+def test_websocket_bot_start_and_stop_real_bot():
+    from backend.bot.trading_bot import TradingBot
+
+    main.market_data_manager = None
+    main.binance_ws_api_client = None
+    bot = TradingBot()
+    main.trading_bot = bot
+
+    client = TestClient(main.app)
+    try:
+        with client.websocket_connect("/ws/bot") as websocket:
+            assert websocket.receive_json().get("type") == "welcome"
+            assert websocket.receive_json().get("type") == "bot_status"
+
+            websocket.send_json({"type": "start_bot", "symbol": "ETHUSDT", "strategy": "simple_ma"})
+            started = websocket.receive_json()
+            assert started.get("type") == "log", started
+            assert websocket.receive_json()["status"]["symbol"] == "ETHUSDT"
+            assert bot.running and (bot.symbol, bot.strategy) == ("ETHUSDT", "simple_ma")
+
+            websocket.send_json({"type": "stop_bot"})
+            assert websocket.receive_json().get("type") == "log"
+            assert not bot.running
+    finally:
+        bot.stop()
+        main.trading_bot = None
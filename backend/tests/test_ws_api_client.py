@@ -75,10 +75,10 @@ class TestSigningAndAuthentication:
         """Create test client."""
         return BinanceWSApiClient("test_key", "test_secret", "wss://test.com")
     
-    @patch('time.time')
+    @patch('time.time_ns')
     def test_sign_params_basic(self, mock_time, client):
         """Test parameter signing without timestamp."""
-        mock_time.return_value = 1234567.890
+        mock_time.return_value = 1234567890123456
         
         params = {'symbol': 'BTCUSDT', 'side': 'BUY'}
         signed = client._sign_params(params)
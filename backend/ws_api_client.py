@@ -17,6 +17,12 @@ import websockets.exceptions
 from unittest.mock import AsyncMock
 # websockets WebSocketClientProtocol not used in this module; removed unused import
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -79,7 +85,7 @@ class BinanceWSApiClient:
         """
         # Add timestamp if not present
         if 'timestamp' not in params:
-            params['timestamp'] = int(time.time() * 1000)
+            params['timestamp'] = time.time_ns() // 1_000_000
 
         # Create query string from parameters (excluding signature)
         sorted_params = dict(sorted(params.items()))
@@ -197,7 +203,8 @@ class BinanceWSApiClient:
             if self.websocket:
                 async for message in self.websocket:
                     try:
-                        data = json.loads(message)
+                        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                        data = _json_loads(message)
                         await self._process_message(data)
                     except json.JSONDecodeError as e:
                         logger.error(f"Failed to parse WebSocket message: {e}")
@@ -151,6 +151,17 @@ const BotPanel: React.FC = () => {
           };
           setLogs(prev => [...prev, logEntry]);
           break;
+
+        case 'log_batch':
+          // Seria logów z backendu przychodzi jedną ramką
+          const batchEntries: LogEntry[] = (message.items || []).map((item: { message: string; timestamp?: string; level?: string }) => ({
+            id: logIdCounterRef.current++,
+            message: item.message,
+            timestamp: item.timestamp || new Date().toLocaleTimeString(),
+            level: (item.level as LogEntry['level']) || extractLogLevel(item.message)
+          }));
+          setLogs(prev => [...prev, ...batchEntries]);
+          break;
           
         case 'bot_error':
         case 'error':
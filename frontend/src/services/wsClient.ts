@@ -16,6 +16,7 @@ export type WSMessage =
   | { type: 'ticker', symbol: string, price: string, change?: string, changePercent?: string }
   | { type: 'orderbook', symbol: string, bids: [string, string][], asks: [string, string][] }
   | { type: 'log', message: string }
+  | { type: 'log_batch', items: { message: string, timestamp?: string }[] }
   | { type: 'bot_status', status: any, running: boolean }
   | { type: 'ping' }
   | { type: 'pong' }
@@ -5,6 +5,11 @@ export interface WSLogMessage {
   timestamp?: string;
 }
 
+export interface WSLogBatchMessage {
+  type: 'log_batch';
+  items: { message: string; timestamp?: string }[];
+}
+
 export interface WSBotStatusMessage {
   type: 'bot_status';
   status: string | { status: string; [key: string]: unknown };
@@ -29,7 +34,7 @@ export interface WSGenericMessage {
   [key: string]: unknown;
 }
 
-export type WSMessage = WSLogMessage | WSBotStatusMessage | WSTickerMessage | WSOrderbookMessage | WSGenericMessage;
+export type WSMessage = WSLogMessage | WSLogBatchMessage | WSBotStatusMessage | WSTickerMessage | WSOrderbookMessage | WSGenericMessage;
 
 export interface BotStatus {
   running: boolean;